@@ -14,57 +14,124 @@ import sys
 import os
 import argparse
 import json
+import traceback
+from functools import lru_cache
 from typing import Dict, Any
 
+from tools import discover_tools, get_tool_by_name
+
+# Optional faster JSON parser for --args; stdlib json is used otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Environment and stdin do not change during a run, so check them once
+_NON_INTERACTIVE = (
+    os.getenv('CI') == 'true' or 
+    os.getenv('GODOTAI_NON_INTERACTIVE') == '1' or
+    not sys.stdin.isatty()
+)
+
+
+def _loads(text: str) -> Any:
+    """Parse a JSON string, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(text.encode())
+    return json.loads(text)
+
 
 def is_non_interactive() -> bool:
     """Check if running in non-interactive mode."""
-    return (
-        os.getenv('CI') == 'true' or 
-        os.getenv('GODOTAI_NON_INTERACTIVE') == '1' or
-        not sys.stdin.isatty()
-    )
+    return _NON_INTERACTIVE
+
+
+@lru_cache(maxsize=None)
+def _enable_ansi_escapes() -> bool:
+    """
+    Enable ANSI escape sequence processing on the console.
+    
+    Runs on the first clear_screen(), so non-interactive runs never touch
+    the console mode; the result is cached.
+    
+    Returns:
+        True if the terminal understands ANSI escapes
+    """
+    if os.name != 'nt':
+        return True
+    
+    # Windows 10+ consoles need ENABLE_VIRTUAL_TERMINAL_PROCESSING turned on
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except Exception:
+        return False
 
 
 def clear_screen():
     """Clear the terminal screen."""
-    if not is_non_interactive():
+    if is_non_interactive():
+        return
+    
+    # Fall back to the shell 'cls' command only where ANSI escapes are unsupported
+    if not _enable_ansi_escapes():
         os.system('cls' if os.name == 'nt' else 'clear')
+    else:
+        sys.stdout.write('\x1b[2J\x1b[H')
+        sys.stdout.flush()
+
+
+def format_header() -> str:
+    """Format the application header."""
+    rule = "=" * 70
+    return f"{rule}\n{'GodotAI Build System'.center(70)}\n{rule}\n\n"
 
 
 def display_header():
     """Display the application header."""
-    print("=" * 70)
-    print("GodotAI Build System".center(70))
-    print("=" * 70)
-    print()
+    sys.stdout.write(format_header())
 
 
 def display_menu(tools: list) -> None:
     """
     Display an interactive menu of available tools.
     
+    The whole menu is written to stdout in a single call.
+    
     Args:
         tools: List of tool instances
     """
     clear_screen()
-    display_header()
+    
+    buf = [format_header()]
     
     for i, tool in enumerate(tools, 1):
-        print(f"{i}. {tool.name}")
-        print(f"   {tool.description}")
+        buf.append(f"{i}. {tool.name}\n")
+        buf.append(f"   {tool.description}\n")
         if tool.arguments:
-            print(f"   Arguments: {len(tool.arguments)}")
-        print()
+            buf.append(f"   Arguments: {len(tool.arguments)}\n")
+        buf.append("\n")
     
-    print("q. Quit")
-    print()
+    buf.append("q. Quit\n\n")
+    
+    sys.stdout.write("".join(buf))
+    sys.stdout.flush()
 
 
 def prompt_for_arguments(tool) -> Dict[str, Any]:
     """
     Prompt the user for tool arguments.
     
+    Every answer, including an accepted default, is checked against the
+    argument's type and choices before it is accepted, so the result
+    needs no further validation.
+    
     Args:
         tool: Tool instance
         
@@ -86,11 +153,8 @@ def prompt_for_arguments(tool) -> Dict[str, Any]:
         if arg.description:
             print(f"  {arg.description}")
         
-        # Handle choices display - filter out empty strings
-        if arg.choices:
-            display_choices = [c for c in arg.choices if c != ""]
-            if display_choices:
-                print(f"  Choices: {', '.join(map(str, display_choices))}")
+        if arg.choices_display:
+            print(f"  Choices: {arg.choices_display}")
         
         # Show default, handling empty string specially
         if arg.default is not None:
@@ -108,42 +172,26 @@ def prompt_for_arguments(tool) -> Dict[str, Any]:
         while True:
             user_input = input(prompt).strip()
             
-            # Use default if empty and default exists
+            # Use default if empty and default exists (checked like typed input)
             if not user_input and arg.default is not None:
                 value = arg.default
+                valid, error = arg.validate(value)
+                if not valid:
+                    print(f"  Default is invalid ({error}); please enter a value")
+                    continue
                 break
             
-            # Handle by type
-            if arg.type == bool:
-                if user_input.lower() in ['y', 'yes', 'true', '1']:
-                    value = True
-                    break
-                elif user_input.lower() in ['n', 'no', 'false', '0']:
-                    value = False
-                    break
-                elif not user_input and not arg.required:
-                    value = False
-                    break
-                else:
-                    print("  Please enter: yes/no (y/n)")
-                    
-            elif arg.type == int:
-                try:
-                    value = int(user_input)
-                    break
-                except ValueError:
-                    print("  Please enter a number")
-                    
-            elif arg.type == list:
-                value = [v.strip() for v in user_input.split(',') if v.strip()]
-                break
-                
-            else:  # str
-                if user_input or not arg.required:
-                    value = user_input
-                    break
-                else:
-                    print("  This field is required")
+            try:
+                value = arg.parse_input(user_input)
+            except ValueError as e:
+                print(f"  {e}")
+                continue
+            
+            if not arg.is_valid_choice(value):
+                print(f"  Please enter one of: {arg.choices_display}")
+                continue
+            
+            break
         
         args[arg.name] = value
     
@@ -162,8 +210,6 @@ def run_non_interactive(tool_name: str, tool_args: Dict[str, Any]) -> int:
     Returns:
         Exit code
     """
-    from tools import get_tool_by_name
-    
     try:
         tool = get_tool_by_name(tool_name, include_hidden=True)
         
@@ -190,16 +236,56 @@ def run_non_interactive(tool_name: str, tool_args: Dict[str, Any]) -> int:
         return 1
     except Exception as e:
         print(f"❌ Fatal error: {e}", file=sys.stderr)
-        import traceback
         traceback.print_exc()
         return 1
 
 
+def run_tool_interactive(tool) -> int:
+    """
+    Prompt for a tool's arguments, then execute it.
+    
+    Args:
+        tool: Tool instance
+        
+    Returns:
+        Exit code
+    """
+    # Prompt for arguments
+    try:
+        args = prompt_for_arguments(tool)
+    except KeyboardInterrupt:
+        print("\n\nCancelled.")
+        return 130
+    
+    # Execute the tool
+    print("-" * 70)
+    print(f"Executing '{tool.name}'...")
+    print("-" * 70)
+    
+    try:
+        result = tool.execute(args)
+    except KeyboardInterrupt:
+        print("\n\n❌ Interrupted by user")
+        result = 130
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        traceback.print_exc()
+        result = 1
+    
+    # Show result
+    print()
+    print("=" * 70)
+    if result == 0:
+        print(f"✅ '{tool.name}' completed successfully!")
+    else:
+        print(f"❌ '{tool.name}' failed with exit code {result}")
+    print("=" * 70)
+    
+    return result
+
+
 def run_interactive():
     """Run the interactive menu."""
-    # Import here to avoid circular imports
-    from tools import discover_tools
-    
     # Get ALL tools (including hidden ones for execution)
     all_tools = discover_tools(include_hidden=True)
     
@@ -215,6 +301,10 @@ def run_interactive():
         print("❌ Error: No visible tools found!")
         return 1
     
+    # A single tool needs no menu - run it once and exit
+    if len(visible_tools) == 1 and not is_non_interactive():
+        return run_tool_interactive(visible_tools[0])
+    
     while True:
         # Display only visible tools in the menu
         display_menu(visible_tools)
@@ -235,48 +325,8 @@ def run_interactive():
             input()
             continue
         
-        # Get the selected tool from visible list
-        tool = visible_tools[index]
-        
-        # Prompt for arguments
-        try:
-            args = prompt_for_arguments(tool)
-        except KeyboardInterrupt:
-            print("\n\nCancelled.")
-            input("\nPress Enter to continue...")
-            continue
-        
-        # Validate arguments
-        valid, error = tool.validate_args(args)
-        if not valid:
-            print(f"\n❌ Error: {error}")
-            input("\nPress Enter to continue...")
-            continue
-        
-        # Execute the tool
-        print("-" * 70)
-        print(f"Executing '{tool.name}'...")
-        print("-" * 70)
-        
-        try:
-            result = tool.execute(args)
-        except KeyboardInterrupt:
-            print("\n\n❌ Interrupted by user")
-            result = 130
-        except Exception as e:
-            print(f"\n❌ Error: {e}")
-            import traceback
-            traceback.print_exc()
-            result = 1
-        
-        # Show result
-        print()
-        print("=" * 70)
-        if result == 0:
-            print(f"✅ '{tool.name}' completed successfully!")
-        else:
-            print(f"❌ '{tool.name}' failed with exit code {result}")
-        print("=" * 70)
+        # Run the selected tool from visible list
+        run_tool_interactive(visible_tools[index])
         
         input("\nPress Enter to continue...")
 
@@ -325,8 +375,8 @@ def main():
             tool_args = {}
             if cli_args.args:
                 try:
-                    tool_args = json.loads(cli_args.args)
-                except json.JSONDecodeError as e:
+                    tool_args = _loads(cli_args.args)
+                except (json.JSONDecodeError, ValueError) as e:
                     print(f"❌ Invalid JSON arguments: {e}", file=sys.stderr)
                     print(f"Received: {cli_args.args}", file=sys.stderr)
                     return 1
@@ -341,7 +391,6 @@ def main():
         return 0
     except Exception as e:
         print(f"\n❌ Fatal error: {e}")
-        import traceback
         traceback.print_exc()
         return 1
 
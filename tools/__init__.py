@@ -7,82 +7,307 @@ by finding classes that inherit from BaseTool.
 
 import os
 import sys
-import importlib.util
-from typing import List
+import ast
+import importlib
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType
+from typing import Dict, List, Optional
 from pathlib import Path
 from tools.base_tool import BaseTool
 
 
-def discover_tools(include_hidden: bool = True) -> List[BaseTool]:
+# Discovery results keyed by include_hidden, populated once per process
+_CACHE: Dict[bool, List[BaseTool]] = {}
+
+# Tool instances per imported module file, so each module is instantiated once
+_MODULE_TOOLS: Dict[Path, List[BaseTool]] = {}
+
+# Declared tool name -> module file, built without importing any tool
+_NAME_INDEX: Dict[str, Path] = {}
+
+# Modification time of each module file when the name index was built
+_INDEX_MTIMES: Dict[Path, float] = {}
+
+# Tool name -> instance for every tool resolved so far
+_TOOL_BY_NAME: Dict[str, BaseTool] = {}
+
+
+def clear_tool_cache() -> None:
+    """Forget all discovered tools so the next lookup rescans tools/."""
+    _CACHE.clear()
+    _MODULE_TOOLS.clear()
+    _NAME_INDEX.clear()
+    _INDEX_MTIMES.clear()
+    _TOOL_BY_NAME.clear()
+
+
+def discover_tools(include_hidden: bool = True, refresh: bool = False) -> List[BaseTool]:
     """
     Discover all tools in the tools/ directory.
     
     Scans all .py files in tools/ and looks for classes that
     inherit from BaseTool (but are not BaseTool itself).
     
+    Results are cached for the lifetime of the process, so repeated
+    calls do not re-import tool modules.
+    
     Args:
         include_hidden: If True (default), include all tools.
                        If False, only include tools where visible=True.
                        Note: This only affects MENU DISPLAY, not discoverability!
+        refresh: If True, ignore the cache and rescan the tools/ directory
+                 (modules already imported are reused, not reloaded)
     
     Returns:
         List of instantiated tool objects, sorted by name
     """
+    if refresh:
+        clear_tool_cache()
     
-    tools = []
+    if include_hidden in _CACHE:
+        return _CACHE[include_hidden]
+    
+    if True not in _CACHE:
+        _CACHE[True] = _scan_tools()
+    
+    if not include_hidden:
+        _CACHE[False] = [tool for tool in _CACHE[True] if tool.visible]
+    
+    return _CACHE[include_hidden]
+
+
+def _tool_files() -> List[Path]:
+    """
+    List the tool module files in the tools/ directory.
+    
+    Returns:
+        Paths of all .py files except __init__.py and the base class modules
+    """
     tools_dir = Path(__file__).parent
+    return [
+        filepath for filepath in tools_dir.glob("*.py")
+        if filepath.name not in ['__init__.py', 'base_tool.py', 'cmake_base.py']
+    ]
+
+
+def _declared_tool_names(filepath: Path) -> List[str]:
+    """
+    Read the tool names declared in a module without executing it.
     
-    # Get all .py files in tools/ directory
-    for filepath in tools_dir.glob("*.py"):
-        filename = filepath.name
+    Looks for classes deriving from a *Tool base class (BaseTool or one
+    of its intermediate bases) whose ``name`` property returns a string
+    literal.
+    
+    Args:
+        filepath: Tool module to inspect
         
-        # Skip special files
-        if filename in ['__init__.py', 'base_tool.py']:
+    Returns:
+        List of declared tool names (may be empty)
+    """
+    try:
+        tree = ast.parse(filepath.read_bytes(), filename=str(filepath))
+    except (OSError, SyntaxError, ValueError):
+        return []
+    
+    names = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        if not any(isinstance(base, ast.Name) and base.id.endswith("Tool") for base in node.bases):
             continue
         
-        # Import the module
-        module_name = filename[:-3]  # Remove .py extension
-        spec = importlib.util.spec_from_file_location(module_name, filepath)
+        for item in node.body:
+            if isinstance(item, ast.FunctionDef) and item.name == "name":
+                for stmt in item.body:
+                    if (isinstance(stmt, ast.Return) and
+                        isinstance(stmt.value, ast.Constant) and
+                        isinstance(stmt.value.value, str)):
+                        names.append(stmt.value.value)
+    
+    return names
+
+
+def _tool_name_index() -> Dict[str, Path]:
+    """
+    Map declared tool names to the module files that define them.
+    
+    Built from a static AST scan so no tool module is executed.
+    
+    Returns:
+        Dictionary of tool name -> module path
+    """
+    if not _NAME_INDEX:
+        for filepath in _tool_files():
+            try:
+                _INDEX_MTIMES[filepath] = filepath.stat().st_mtime
+            except OSError:
+                continue
+            for tool_name in _declared_tool_names(filepath):
+                _NAME_INDEX.setdefault(tool_name, filepath)
+    
+    return _NAME_INDEX
+
+
+def _find_module_for_tool(name: str) -> Optional[Path]:
+    """
+    Find the module file that declares a tool.
+    
+    The name index is rebuilt when the name is missing or the indexed
+    file has changed on disk since it was scanned.
+    
+    Args:
+        name: Tool name to find
         
-        if spec is None or spec.loader is None:
-            continue
+    Returns:
+        Path to the declaring module, or None if no module declares it
+    """
+    filepath = _tool_name_index().get(name)
+    
+    if filepath is not None:
+        try:
+            if filepath.stat().st_mtime == _INDEX_MTIMES.get(filepath):
+                return filepath
+        except OSError:
+            pass
+    
+    # Missing or stale - rescan declarations once
+    _NAME_INDEX.clear()
+    _INDEX_MTIMES.clear()
+    return _tool_name_index().get(name)
+
+
+def _import_tool_module(filepath: Path) -> Optional[ModuleType]:
+    """
+    Import a tool module as a submodule of this package.
+    
+    Going through the regular import system reuses sys.modules and the
+    .pyc bytecode cache, so an already-imported module costs nothing.
+    
+    Args:
+        filepath: Tool module file inside tools/
+        
+    Returns:
+        The loaded module, or None if it could not be loaded
+    """
+    module_name = filepath.stem
+    
+    try:
+        return importlib.import_module(f"{__package__}.{module_name}")
+    except Exception as e:
+        print(f"Warning: Failed to load tool module '{module_name}': {e}")
+        return None
+
+
+def _tool_subclasses() -> List[type]:
+    """
+    List every subclass of BaseTool, including indirect ones.
+    
+    Tools may derive from intermediate bases such as CMakeBuildTool.
+    
+    Returns:
+        List of BaseTool subclasses
+    """
+    classes = []
+    pending = list(BaseTool.__subclasses__())
+    while pending:
+        tool_class = pending.pop()
+        classes.append(tool_class)
+        pending.extend(tool_class.__subclasses__())
+    return classes
+
+
+def _instantiate_tools(module: Optional[ModuleType]) -> List[BaseTool]:
+    """
+    Instantiate the BaseTool subclasses defined by a loaded module.
+    
+    Args:
+        module: Module returned by _import_tool_module (None yields no tools)
         
+    Returns:
+        List of tool instances defined in the module
+    """
+    tools = []
+    if module is None:
+        return tools
+    
+    # Only concrete classes bound in the module itself (not stale or re-exported ones)
+    for tool_class in _tool_subclasses():
+        if (tool_class.__module__ != module.__name__ or
+            getattr(module, tool_class.__name__, None) is not tool_class or
+            inspect.isabstract(tool_class)):
+            continue
         try:
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+            tools.append(tool_class())
         except Exception as e:
-            print(f"Warning: Failed to load tool module '{module_name}': {e}")
+            print(f"Warning: Failed to instantiate tool '{tool_class.__name__}': {e}")
             continue
+    
+    return tools
+
+
+def _load_tools_from_file(filepath: Path) -> List[BaseTool]:
+    """
+    Import a single tool module and instantiate its BaseTool subclasses.
+    
+    Each module is instantiated at most once per cache lifetime.
+    
+    Args:
+        filepath: Tool module to import
         
-        # Find BaseTool subclasses in the module
-        for attr_name in dir(module):
-            attr = getattr(module, attr_name)
-            
-            # Check if it's a class that inherits from BaseTool
-            if (isinstance(attr, type) and 
-                issubclass(attr, BaseTool) and 
-                attr is not BaseTool):
-                try:
-                    tool_instance = attr()
-                    
-                    # Filter by visibility if requested
-                    # NOTE: include_hidden=False is only for menu filtering!
-                    # Tools should ALWAYS be discoverable for execute_tool() calls
-                    if include_hidden or tool_instance.visible:
-                        tools.append(tool_instance)
-                        
-                except Exception as e:
-                    print(f"Warning: Failed to instantiate tool '{attr_name}': {e}")
-                    continue
-    
-    # Sort tools by name
-    return sorted(tools, key=lambda t: t.name)
+    Returns:
+        List of tool instances defined in the module
+    """
+    if filepath not in _MODULE_TOOLS:
+        _MODULE_TOOLS[filepath] = _instantiate_tools(_import_tool_module(filepath))
+    
+    return _MODULE_TOOLS[filepath]
+
+
+def _scan_tools() -> List[BaseTool]:
+    """
+    Import every tool module and instantiate its BaseTool subclasses.
+    
+    Modules not yet loaded are executed concurrently; instantiation
+    happens afterwards on the calling thread.
+    
+    Returns:
+        List of all tool instances (including hidden ones), sorted by name
+    """
+    filepaths = _tool_files()
+    pending = [filepath for filepath in filepaths if filepath not in _MODULE_TOOLS]
+    
+    if pending:
+        with ThreadPoolExecutor(max_workers=min(8, len(pending))) as executor:
+            modules = list(executor.map(_import_tool_module, pending))
+        
+        for filepath, module in zip(pending, modules):
+            _MODULE_TOOLS[filepath] = _instantiate_tools(module)
+    
+    # Group instances by name (one .name access per tool)
+    by_name: Dict[str, List[BaseTool]] = {}
+    for filepath in filepaths:
+        for tool in _MODULE_TOOLS[filepath]:
+            by_name.setdefault(tool.name, []).append(tool)
+    
+    for tool_name, named_tools in by_name.items():
+        _TOOL_BY_NAME.setdefault(tool_name, named_tools[0])
+    
+    # Emit in the order of the pre-sorted name strings
+    tools = []
+    for tool_name in sorted(by_name):
+        tools.extend(by_name[tool_name])
+    
+    return tools
 
 
 def get_tool_by_name(name: str, include_hidden: bool = True) -> BaseTool:
     """
     Get a specific tool by name.
     
+    Only the module declaring the tool is imported when it can be
+    located by the static name index; otherwise all tools are discovered.
+    
     Args:
         name: Tool name to find
         include_hidden: If True (default), search all tools including hidden ones.
@@ -94,13 +319,38 @@ def get_tool_by_name(name: str, include_hidden: bool = True) -> BaseTool:
     Raises:
         ValueError: If tool not found
     """
-    tools = discover_tools(include_hidden=include_hidden)
+    tool = _lookup_tool(name)
+    
+    if tool is None or not (include_hidden or tool.visible):
+        raise ValueError(f"Tool '{name}' not found")
+    
+    return tool
+
+
+def _lookup_tool(name: str) -> Optional[BaseTool]:
+    """
+    Resolve a tool instance by name, caching the result.
+    
+    Args:
+        name: Tool name to find
+        
+    Returns:
+        Tool instance, or None if no tool has that name
+    """
+    if name in _TOOL_BY_NAME:
+        return _TOOL_BY_NAME[name]
     
-    for tool in tools:
-        if tool.name == name:
-            return tool
+    filepath = _find_module_for_tool(name)
+    if filepath is not None:
+        for tool in _load_tools_from_file(filepath):
+            if tool.name == name:
+                _TOOL_BY_NAME[name] = tool
+                return tool
     
-    raise ValueError(f"Tool '{name}' not found")
+    # Tool not declared statically (e.g. computed name) or added since the
+    # last scan - rescan everything rather than trusting the cached list
+    discover_tools(include_hidden=True, refresh=True)
+    return _TOOL_BY_NAME.get(name)
 
 
 def discover_tools_by_category(category: str, include_hidden: bool = True) -> List[BaseTool]:
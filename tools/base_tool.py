@@ -6,20 +6,247 @@ Each tool should inherit from BaseTool and implement:
 - description: What the tool does
 - category: Tool category for organization (optional, defaults to 'misc')
 - visible: Whether tool appears in main menu (optional, defaults to True)
-- arguments: List of ToolArgument objects (optional)
+- _define_arguments(): List of ToolArgument objects (optional)
 - execute(args): Main execution logic
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Callable, Tuple
+from dataclasses import dataclass, field
 from pathlib import Path
 import json
 import os
+import shutil
+import subprocess
 import sys
+import threading
 
+# Optional faster JSON parser; stdlib json is used otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON from raw bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=None)
+def resolve_exe(name: str) -> str:
+    """
+    Resolve an executable on PATH, searching at most once per process.
+    
+    Args:
+        name: Executable name (e.g. 'cmake')
+        
+    Returns:
+        Full path to the executable, or the bare name if it is not on PATH
+        (so running it still raises FileNotFoundError as before)
+    """
+    return shutil.which(name) or name
+
+
+@lru_cache(maxsize=1)
+def detect_jobs() -> int:
+    """
+    Number of CPUs this process may run on, for parallel build jobs.
+    
+    Honors CPU affinity (e.g. container CPU limits) where the OS supports it.
+    
+    Returns:
+        Job count (at least 1)
+    """
+    try:
+        return max(1, len(os.sched_getaffinity(0)))
+    except AttributeError:
+        # Not available on Windows/macOS
+        return os.cpu_count() or 1
+
+
+# Serializes console writes from tools running on worker threads
+_OUTPUT_LOCK = threading.Lock()
+_job_local = threading.local()
+
+
+class BuildJob:
+    """
+    A tool run on a worker thread alongside others.
+    
+    While running, the job's console output is prefixed with its label
+    (inside prefixed_output()), and cancel() stops its current and any
+    later run_streamed() commands.
+    """
+    
+    def __init__(self, label: str):
+        self.label = label
+        self.cancelled = threading.Event()
+        self._prefix = f"[{label}] "
+        self._partial = ""
+        self._procs = set()
+        self._procs_lock = threading.Lock()
+    
+    def run(self, func: Callable[..., int], *args: Any) -> int:
+        """
+        Call func on the current thread as this job.
+        
+        Args:
+            func: Function to call (e.g. BaseTool.execute_tool)
+            *args: Arguments for func
+            
+        Returns:
+            The return value of func
+        """
+        _job_local.job = self
+        try:
+            return func(*args)
+        finally:
+            _job_local.job = None
+            if self._partial:
+                self._write_lines(self._partial + "\n")
+    
+    def cancel(self) -> None:
+        """Stop the job: terminate its running command and refuse new ones."""
+        self.cancelled.set()
+        with self._procs_lock:
+            procs = list(self._procs)
+        for proc in procs:
+            try:
+                proc.terminate()
+            except OSError:
+                pass  # Already exited
+    
+    def _track(self, proc: subprocess.Popen) -> None:
+        with self._procs_lock:
+            self._procs.add(proc)
+        # cancel() may have run before the process was registered
+        if self.cancelled.is_set():
+            proc.terminate()
+    
+    def _untrack(self, proc: subprocess.Popen) -> None:
+        with self._procs_lock:
+            self._procs.discard(proc)
+    
+    def _write_lines(self, text: str) -> None:
+        """Write complete lines with the job prefix; keep a trailing partial line."""
+        lines = (self._partial + text).split("\n")
+        self._partial = lines.pop()
+        if lines:
+            stream = sys.stdout
+            target = stream.wrapped if isinstance(stream, _PrefixedStdout) else stream
+            with _OUTPUT_LOCK:
+                target.write("".join(f"{self._prefix}{line}\n" for line in lines))
+                target.flush()
+
+
+def current_job() -> Optional[BuildJob]:
+    """The BuildJob running on this thread, if any."""
+    return getattr(_job_local, "job", None)
+
+
+class _PrefixedStdout:
+    """stdout wrapper that routes writes from BuildJob threads through their prefix."""
+    
+    def __init__(self, wrapped):
+        self.wrapped = wrapped
+    
+    def write(self, text: str) -> int:
+        job = current_job()
+        if job is None:
+            with _OUTPUT_LOCK:
+                self.wrapped.write(text)
+        else:
+            job._write_lines(text)
+        return len(text)
+    
+    def flush(self) -> None:
+        with _OUTPUT_LOCK:
+            self.wrapped.flush()
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.wrapped, name)
+
+
+@contextmanager
+def prefixed_output():
+    """
+    Prefix console output of BuildJob threads with their labels.
+    
+    Lines from concurrent jobs are written whole, so they never interleave
+    mid-line. Output from other threads passes through unchanged.
+    """
+    original = sys.stdout
+    sys.stdout = _PrefixedStdout(original)
+    try:
+        yield
+    finally:
+        sys.stdout = original
+
+
+# Tool configuration file and its parsed contents (see get_tool_config)
+_CONFIG_PATH = Path(__file__).parent / "config.json"
+_CONFIG_CACHE: Optional[Dict[str, Any]] = None
+_CONFIG_MTIME: Optional[float] = None
+
+_YES_INPUTS = frozenset({'y', 'yes', 'true', '1'})
+_NO_INPUTS = frozenset({'n', 'no', 'false', '0'})
+
+
+def _parse_bool(text: str, required: bool) -> bool:
+    """Parse a yes/no answer."""
+    lowered = text.lower()
+    if lowered in _YES_INPUTS:
+        return True
+    if lowered in _NO_INPUTS:
+        return False
+    if not text and not required:
+        return False
+    raise ValueError("Please enter: yes/no (y/n)")
+
+
+def _parse_int(text: str, required: bool) -> int:
+    """Parse an integer answer."""
+    try:
+        return int(text)
+    except ValueError:
+        raise ValueError("Please enter a number") from None
+
+
+def _parse_list(text: str, required: bool) -> List[str]:
+    """Parse a comma-separated answer."""
+    return [v.strip() for v in text.split(',') if v.strip()]
+
+
+def _parse_str(text: str, required: bool) -> str:
+    """Parse a free-form answer."""
+    if text or not required:
+        return text
+    raise ValueError("This field is required")
+
+
+# Input parser for each supported argument type
+_PARSERS: Dict[type, Callable[[str, bool], Any]] = {
+    bool: _parse_bool,
+    int: _parse_int,
+    list: _parse_list,
+    str: _parse_str,
+}
+
+
+# Type checks that differ from a plain isinstance()
+_TYPE_CHECKS: Dict[type, Callable[[Any], bool]] = {
+    # bool is a subclass of int, but True/False are not valid numbers here
+    int: lambda value: isinstance(value, int) and not isinstance(value, bool),
+}
+
+
+@dataclass(slots=True, frozen=True)
 class ToolArgument:
     """Describes an argument that a tool accepts."""
     
@@ -28,7 +255,53 @@ class ToolArgument:
     type: type  # str, int, bool, list
     required: bool = False
     default: Any = None
-    choices: Optional[List[str]] = None  # For enum-like arguments
+    choices: Optional[Tuple[str, ...]] = None  # For enum-like arguments (lists are converted)
+    choices_display: str = field(init=False, repr=False, compare=False)  # Choices shown in prompts
+    _parse: Callable[[str, bool], Any] = field(init=False, repr=False, compare=False)
+    _choices_set: Optional[frozenset] = field(init=False, repr=False, compare=False)
+    _type_check: Callable[[Any], bool] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Frozen dataclass - derived fields must bypass __setattr__
+        # Store choices as a tuple so instances stay hashable
+        if self.choices is not None and not isinstance(self.choices, tuple):
+            object.__setattr__(self, 'choices', tuple(self.choices))
+        
+        # Resolve the input parser once instead of per prompt
+        object.__setattr__(self, '_parse', _PARSERS.get(self.type, _parse_str))
+        
+        # Empty-string choices mean "use config" and are not shown
+        object.__setattr__(self, 'choices_display',
+                           ', '.join(str(c) for c in (self.choices or ()) if c != ""))
+        
+        object.__setattr__(self, '_choices_set',
+                           frozenset(self.choices) if self.choices else None)
+        object.__setattr__(self, '_type_check', _TYPE_CHECKS.get(
+            self.type, lambda value, expected=self.type: isinstance(value, expected)))
+    
+    def is_valid_choice(self, value: Any) -> bool:
+        """Check a value against this argument's choices (if it has any)."""
+        if self._choices_set is None:
+            return True
+        try:
+            return value in self._choices_set
+        except TypeError:
+            return False  # Unhashable (e.g. a list from a JSON config) is never a choice
+    
+    def parse_input(self, text: str) -> Any:
+        """
+        Convert interactive user input to this argument's type.
+        
+        Args:
+            text: Stripped user input
+            
+        Returns:
+            Parsed value
+            
+        Raises:
+            ValueError: If the input is not acceptable (message is user-facing)
+        """
+        return self._parse(text, self.required)
     
     def validate(self, value: Any) -> tuple[bool, str]:
         """
@@ -46,11 +319,11 @@ class ToolArgument:
             return True, ""
         
         # Check type
-        if not isinstance(value, self.type):
+        if not self._type_check(value):
             return False, f"'{self.name}' must be of type {self.type.__name__}"
         
         # Check choices
-        if self.choices and value not in self.choices:
+        if not self.is_valid_choice(value):
             return False, f"'{self.name}' must be one of: {', '.join(map(str, self.choices))}"
         
         return True, ""
@@ -64,6 +337,9 @@ class BaseTool(ABC):
     Each tool must implement name, description, and execute().
     """
     
+    # Resolved repository root, shared by all tools
+    _ROOT_DIR: Optional[Path] = None
+    
     @property
     @abstractmethod
     def name(self) -> str:
@@ -113,7 +389,21 @@ class BaseTool(ABC):
         return True
     
     @property
-    def arguments(self) -> List[ToolArgument]:
+    def arguments(self) -> Tuple[ToolArgument, ...]:
+        """
+        Arguments this tool accepts.
+        
+        Built once from _define_arguments() and cached on the instance.
+        
+        Returns:
+            Tuple of ToolArgument objects
+        """
+        if getattr(self, '_args_cache', None) is None:
+            self._args_cache = tuple(self._define_arguments())
+            self._args_by_name = {arg.name: arg for arg in self._args_cache}
+        return self._args_cache
+    
+    def _define_arguments(self) -> List[ToolArgument]:
         """
         List of arguments this tool accepts.
         Override this if your tool needs arguments.
@@ -123,6 +413,19 @@ class BaseTool(ABC):
         """
         return []
     
+    def get_argument(self, name: str) -> Optional[ToolArgument]:
+        """
+        Look up an argument definition by name.
+        
+        Args:
+            name: Argument name
+            
+        Returns:
+            ToolArgument, or None if this tool has no such argument
+        """
+        self.arguments  # Ensure the name index is built
+        return self._args_by_name.get(name)
+    
     @abstractmethod
     def execute(self, args: Dict[str, Any]) -> int:
         """
@@ -174,28 +477,49 @@ class BaseTool(ABC):
         Returns:
             Path to repository root
         """
-        # tools/base_tool.py -> tools/ -> root/
-        return Path(__file__).parent.parent.resolve()
+        if BaseTool._ROOT_DIR is None:
+            # tools/base_tool.py -> tools/ -> root/
+            BaseTool._ROOT_DIR = Path(__file__).parent.parent.resolve()
+        return BaseTool._ROOT_DIR
+    
+    @property
+    def root_dir(self) -> Path:
+        """Repository root directory (resolved once, see get_root_dir)."""
+        return self.get_root_dir()
     
     def get_tool_config(self) -> Dict[str, Any]:
         """
         Get tool-specific configuration from tools/config.json.
         
+        The file is parsed once and re-read only when its modification
+        time changes.
+        
         Returns:
             Dictionary of configuration for this tool
         """
-        config_path = Path(__file__).parent / "config.json"
-        
-        if not config_path.exists():
-            return {}
+        global _CONFIG_CACHE, _CONFIG_MTIME
         
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-                return config.get(self.name, {})
-        except Exception as e:
-            print(f"Warning: Failed to load tool config: {e}")
+            mtime = _CONFIG_PATH.stat().st_mtime
+        except OSError:
             return {}
+        
+        if _CONFIG_CACHE is None or mtime != _CONFIG_MTIME:
+            try:
+                _CONFIG_CACHE = _json_loads(_CONFIG_PATH.read_bytes())
+                _CONFIG_MTIME = mtime
+            except Exception as e:
+                print(f"Warning: Failed to load tool config: {e}")
+                return {}
+        
+        return _CONFIG_CACHE.get(self.name, {})
+    
+    @staticmethod
+    def clear_config_cache() -> None:
+        """Forget the parsed tools/config.json so the next read reloads it."""
+        global _CONFIG_CACHE, _CONFIG_MTIME
+        _CONFIG_CACHE = None
+        _CONFIG_MTIME = None
     
     def discover_tools_by_category(self, category: str) -> List['BaseTool']:
         """
@@ -235,6 +559,73 @@ class BaseTool(ABC):
             self.print_error(str(e))
             return 1
     
+    def link_or_copy(self, src: Path, dst: Path) -> None:
+        """
+        Place a file at dst, hardlinking it when possible.
+        
+        A hardlink is a metadata-only operation; if linking fails (different
+        filesystem, unsupported, permissions) the file is copied instead.
+        
+        Args:
+            src: Source file
+            dst: Destination file (replaced if it exists)
+        """
+        try:
+            if dst.exists() and os.path.samefile(src, dst):
+                return
+            dst.unlink(missing_ok=True)
+            os.link(src, dst)
+        except OSError:
+            shutil.copy2(src, dst)
+    
+    def run_streamed(self, command: List[str], cwd: Optional[Path] = None,
+                     tail_lines: int = 200,
+                     echo: Optional[Callable[[str], bool]] = None) -> Tuple[int, List[str]]:
+        """
+        Run a command, echoing its combined stdout/stderr as it arrives.
+        
+        Only the last few lines are kept in memory, for error reporting.
+        
+        Args:
+            command: Command and arguments
+            cwd: Working directory (None = current)
+            tail_lines: Number of trailing output lines to keep
+            echo: Decides which lines are printed (None = print every line)
+            
+        Returns:
+            (exit_code, last_output_lines)
+            
+        Raises:
+            FileNotFoundError: If the executable is not found
+        """
+        tail = deque(maxlen=tail_lines)
+        
+        # A cancelled job (a sibling build failed) starts no further commands
+        job = current_job()
+        if job is not None and job.cancelled.is_set():
+            return 1, ["Cancelled\n"]
+        
+        with subprocess.Popen(
+            command,
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=-1
+        ) as proc:
+            if job is not None:
+                job._track(proc)
+            try:
+                for line in proc.stdout:
+                    if echo is None or echo(line):
+                        sys.stdout.write(line)
+                    tail.append(line)
+            finally:
+                if job is not None:
+                    job._untrack(proc)
+        
+        return proc.returncode, list(tail)
+    
     def confirm(self, message: str, default: bool = False) -> bool:
         """
         Ask user for confirmation (skips in CI).
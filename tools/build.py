@@ -3,17 +3,39 @@ Build orchestrator tool.
 
 Coordinates the building of all components (dependencies + plugin)
 in the correct order according to tools/config.json configuration.
+Components that do not depend on each other are built concurrently.
 """
 
+import os
+import platform
+import sys
+import traceback
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from pathlib import Path
 from typing import Dict, Any, List
 
-from tools.base_tool import BaseTool, ToolArgument
+from tools.base_tool import BaseTool, BuildJob, ToolArgument, detect_jobs, prefixed_output
+
+
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
+
+# Library each dependency tool leaves in build_ext_libs/
+if _IS_WINDOWS:
+    _DEPENDENCY_LIBS = {"build-libgit2": "git2.lib", "build-libhv": "hv_static.lib"}
+else:
+    _DEPENDENCY_LIBS = {"build-libgit2": "libgit2.a", "build-libhv": "libhv_static.a"}
+
+# File extension of the plugin library on this platform
+_PLUGIN_LIB_SUFFIX = {"Windows": ".dll", "Darwin": ".dylib"}.get(_SYSTEM, ".so")
 
 
 class BuildTool(BaseTool):
     """Build all components of GodotAI."""
     
+    # Output existence per build tool, scanned once per execute()
+    _outputs = None
+    
     @property
     def name(self) -> str:
         return "build"
@@ -26,8 +48,7 @@ class BuildTool(BaseTool):
     def category(self) -> str:
         return "build"
     
-    @property
-    def arguments(self):
+    def _define_arguments(self):
         return [
             ToolArgument(
                 name="rebuild",
@@ -47,17 +68,20 @@ class BuildTool(BaseTool):
     
     def execute(self, args: Dict[str, Any]) -> int:
         """Execute the build orchestrator."""
-        root_dir = self.get_root_dir()
+        root_dir = self.root_dir
         
         rebuild = args.get("rebuild", False)
         skip_deps = args.get("skip_deps", False)
         
-        print("\n" + "=" * 70)
-        print("GodotAI Build Orchestrator")
-        print("=" * 70)
-        print(f"\n  Rebuild: {rebuild}")
-        print(f"  Skip Dependencies: {skip_deps}")
-        print()
+        rule = "=" * 70
+        sys.stdout.write(
+            f"\n{rule}\n"
+            "GodotAI Build Orchestrator\n"
+            f"{rule}\n"
+            f"\n  Rebuild: {rebuild}\n"
+            f"  Skip Dependencies: {skip_deps}\n\n"
+        )
+        sys.stdout.flush()
         
         # Get build configuration
         config = self.get_tool_config()
@@ -79,118 +103,193 @@ class BuildTool(BaseTool):
             
             tools_to_build.append(tool_name)
         
-        # Build each component
-        for i, tool_name in enumerate(tools_to_build, 1):
-            print("\n" + "-" * 70)
-            print(f"[{i}/{len(tools_to_build)}] Building: {tool_name}")
-            print("-" * 70)
-            
+        # Decide up front which tools need building, so rebuild prompts
+        # never compete for stdin with tools running in parallel
+        self._outputs = self._scan_outputs(root_dir)
+        pending = []
+        for tool_name in tools_to_build:
             # Check if already built (unless rebuild requested)
             if not rebuild and skip_if_exists:
                 if self._check_output_exists(tool_name):
                     if rebuild_prompt:
-                        response = input(f"\n{tool_name} output already exists. Rebuild? (y/N): ").strip().lower()
-                        if response not in ['y', 'yes']:
+                        # confirm() answers "no" without blocking in CI / non-tty runs
+                        if not self.confirm(f"\n{tool_name} output already exists. Rebuild?"):
                             print(f"✓ Skipping {tool_name}")
                             continue
                     else:
                         print(f"✓ Skipping {tool_name} (already built)")
                         continue
             
-            # Execute the build tool
-            result = self._execute_build_tool(tool_name)
-            
+            pending.append(tool_name)
+        
+        if not pending:
+            print("\n✓ Nothing to build - all outputs are up to date")
+            return 0
+        
+        # A single component needs no scheduling (common incremental loop)
+        if len(pending) == 1:
+            print(f"\n🔨 Building: {pending[0]}")
+            result = self._execute_build_tool(pending[0])
+            if result != 0:
+                self.print_error(f"Failed to build {pending[0]}")
+                return result
+        else:
+            # Build components, running independent ones concurrently
+            result = self._run_build_graph(pending, config.get("dependencies", {}))
             if result != 0:
-                self.print_error(f"Failed to build {tool_name}")
                 return result
         
         # Summary
-        print("\n" + "=" * 70)
+        sys.stdout.write(f"\n{rule}\n")
         self.print_success("All components built successfully!")
-        print("=" * 70)
-        print("\n💡 Next steps:")
-        print("  1. Run 'install' to deploy to a Godot project")
-        print("  2. Or manually copy plugin/ directory to your project's addons/")
-        print()
+        sys.stdout.write(
+            f"{rule}\n"
+            "\n💡 Next steps:\n"
+            "  1. Run 'install' to deploy to a Godot project\n"
+            "  2. Or manually copy plugin/ directory to your project's addons/\n\n"
+        )
+        sys.stdout.flush()
         
         return 0
     
-    def _check_output_exists(self, tool_name: str) -> bool:
+    def _run_build_graph(self, tool_names: List[str],
+                         dependencies: Dict[str, List[str]]) -> int:
         """
-        Check if a tool's output already exists.
+        Build tools in dependency order, running independent tools in parallel.
+        
+        Dependencies on tools that are not being built (skipped or
+        already up to date) count as satisfied.
         
         Args:
-            tool_name: Name of the build tool
+            tool_names: Tools to build, in priority order
+            dependencies: Map of tool name -> tool names it depends on
             
         Returns:
-            True if output exists
+            0 if every tool built, otherwise the first failing exit code
+            (1 if dependencies form a cycle)
         """
-        root_dir = self.get_root_dir()
+        remaining = {
+            name: {dep for dep in dependencies.get(name, []) if dep in tool_names}
+            for name in tool_names
+        }
+        total = len(tool_names)
+        started = 0
+        failure = 0
         
-        # Get tool-specific config
-        try:
-            tool = self.execute_tool.__self__  # Get self reference
-            from tools import get_tool_by_name
-            tool_instance = get_tool_by_name(tool_name)
-            tool_config = tool_instance.get_tool_config()
-        except:
-            return False
-        
-        # Check for output files
-        if tool_name == "build-libgit2":
-            lib_dir = root_dir / "build_ext_libs"
-            import platform
-            if platform.system() == "Windows":
-                lib_file = lib_dir / "git2.lib"
-            else:
-                lib_file = lib_dir / "libgit2.a"
-            return lib_file.exists()
-        
-        elif tool_name == "build-libhv":
-            lib_dir = root_dir / "build_ext_libs"
-            import platform
-            if platform.system() == "Windows":
-                lib_file = lib_dir / "hv_static.lib"
-            else:
-                lib_file = lib_dir / "libhv_static.a"
-            return lib_file.exists()
-        
-        elif tool_name == "build-plugin":
-            # Check if plugin binary exists in staging
-            plugin_bin = root_dir / "plugin" / "bin"
-            if not plugin_bin.exists():
-                return False
-            
-            # Check for any library files
-            import platform
-            system = platform.system()
+        # Tools run external build processes, so threads are enough.
+        # Concurrent tools get their output lines prefixed with the tool name.
+        with prefixed_output(), ThreadPoolExecutor(max_workers=max(1, total)) as executor:
+            running = {}
             
-            if system == "Windows":
-                pattern = "*.dll"
-            elif system == "Darwin":
-                pattern = "*.dylib"
-            else:
-                pattern = "*.so"
+            while remaining or running:
+                # Submit every tool whose dependencies have all finished
+                if not failure:
+                    ready = [name for name in tool_names
+                             if name in remaining and not remaining[name]]
+                    # Share the CPUs between the tools building at the same time
+                    jobs = max(1, detect_jobs() // max(1, len(running) + len(ready)))
+                    for name in ready:
+                        del remaining[name]
+                        started += 1
+                        sys.stdout.write(
+                            f"\n{'-' * 70}\n[{started}/{total}] Building: {name}\n{'-' * 70}\n"
+                        )
+                        sys.stdout.flush()
+                        job = BuildJob(name)
+                        running[executor.submit(job.run, self._execute_build_tool, name, jobs)] = job
+                
+                if not running:
+                    break
+                
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = running.pop(future)
+                    result = future.result()
+                    
+                    if result != 0:
+                        if job.cancelled.is_set():
+                            self.print_warning(f"Cancelled {job.label}")
+                        else:
+                            self.print_error(f"Failed to build {job.label}")
+                            # Stop the tools still building; their results are not used
+                            for other in running.values():
+                                other.cancel()
+                        failure = failure or result
+                        continue
+                    
+                    for deps in remaining.values():
+                        deps.discard(job.label)
+        
+        if remaining and not failure:
+            # Nothing was ready although tools were left: a dependency cycle
+            self.print_error(f"Unresolvable build dependencies: {', '.join(remaining)}")
+            for name in remaining:
+                print(f"  {name} waits for: {', '.join(sorted(remaining[name]))}")
+            return 1
+        
+        return failure
+    
+    def _scan_outputs(self, root_dir: Path) -> Dict[str, bool]:
+        """
+        Check which build tools already have their outputs on disk.
+        
+        Reads build_ext_libs/ with a single scandir and walks plugin/bin
+        once, instead of probing paths separately for every tool.
+        
+        Args:
+            root_dir: Repository root
             
-            # Check in platform-specific subdirectories
-            for platform_dir in plugin_bin.iterdir():
-                if platform_dir.is_dir():
-                    libs = list(platform_dir.glob(pattern))
-                    if libs:
-                        return True
+        Returns:
+            Dictionary of tool name -> True if its output exists
+        """
+        # Dependency libraries in build_ext_libs/
+        try:
+            with os.scandir(root_dir / "build_ext_libs") as entries:
+                built_libs = {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            built_libs = set()
+        
+        outputs = {
+            tool_name: lib_name in built_libs
+            for tool_name, lib_name in _DEPENDENCY_LIBS.items()
+        }
+        
+        # Plugin library in plugin/bin/ or one of its platform subdirectories
+        outputs["build-plugin"] = False
+        plugin_bin = str(root_dir / "plugin" / "bin")
+        for dirpath, dirnames, filenames in os.walk(plugin_bin):
+            # Stop at the first library file
+            if any(filename.endswith(_PLUGIN_LIB_SUFFIX) for filename in filenames):
+                outputs["build-plugin"] = True
+                break
             
-            # Also check root bin directory
-            libs = list(plugin_bin.glob(pattern))
-            return len(libs) > 0
+            # Only plugin/bin and its direct subdirectories are searched
+            if dirpath != plugin_bin:
+                dirnames.clear()
         
-        return False
+        return outputs
     
-    def _execute_build_tool(self, tool_name: str) -> int:
+    def _check_output_exists(self, tool_name: str) -> bool:
+        """
+        Check if a tool's output already exists.
+        
+        Args:
+            tool_name: Name of the build tool
+            
+        Returns:
+            True if output exists
+        """
+        if self._outputs is None:
+            self._outputs = self._scan_outputs(self.root_dir)
+        return self._outputs.get(tool_name, False)
+    
+    def _execute_build_tool(self, tool_name: str, jobs: int = 0) -> int:
         """
         Execute a specific build tool.
         
         Args:
             tool_name: Name of the tool to execute
+            jobs: Parallel compile jobs for the tool (0 = auto)
             
         Returns:
             Exit code from the tool
@@ -200,7 +299,8 @@ class BuildTool(BaseTool):
             if tool_name.startswith("build-lib"):
                 return self.execute_tool(tool_name, {
                     "config": "Release",
-                    "clean": False
+                    "clean": False,
+                    "jobs": jobs
                 })
             
             # For plugin build, use default settings
@@ -210,7 +310,7 @@ class BuildTool(BaseTool):
                     "target": "",
                     "architecture": "",
                     "precision": "",
-                    "jobs": 0,
+                    "jobs": jobs,
                     "clean": False,
                     "install": True
                 })
@@ -221,6 +321,8 @@ class BuildTool(BaseTool):
         
         except Exception as e:
             self.print_error(f"Failed to execute {tool_name}: {e}")
-            import traceback
-            traceback.print_exc()
+            # Full (bounded) traceback only when debugging
+            if os.environ.get("GODOTAI_DEBUG"):
+                traceback.print_exception(type(e), e, e.__traceback__,
+                                          limit=10, file=sys.stderr)
             return 1
\ No newline at end of file
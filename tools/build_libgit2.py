@@ -5,17 +5,25 @@ Builds the libgit2 git operations library using CMake.
 The built library will be used for git integration in Phase 6.
 """
 
-import subprocess
-import shutil
+import os
+import sys
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
-from tools.base_tool import BaseTool, ToolArgument
+from tools.base_tool import ToolArgument
+from tools.cmake_base import CMakeBuildTool
 
 
-class BuildLibgit2Tool(BaseTool):
+# Library file names produced by the libgit2 build (Windows, Linux/Mac)
+_LIB_NAMES = ("git2.lib", "libgit2.a")
+
+
+class BuildLibgit2Tool(CMakeBuildTool):
     """Build the libgit2 library."""
     
+    project_label = "libgit2"
+    library_names = _LIB_NAMES
+    
     @property
     def name(self) -> str:
         return "build-libgit2"
@@ -32,8 +40,7 @@ class BuildLibgit2Tool(BaseTool):
     def visible(self) -> bool:
         return False  # Hidden from main menu, called by build orchestrator
     
-    @property
-    def arguments(self):
+    def _define_arguments(self):
         return [
             ToolArgument(
                 name="config",
@@ -50,11 +57,39 @@ class BuildLibgit2Tool(BaseTool):
                 required=False,
                 default=False
             ),
+            ToolArgument(
+                name="unity",
+                description="Use a CMake unity build (faster, opt-in: not verified for every libgit2 version)",
+                type=bool,
+                required=False,
+                default=False
+            ),
+            ToolArgument(
+                name="ccache",
+                description="Use sccache/ccache when installed",
+                type=bool,
+                required=False,
+                default=True
+            ),
+            ToolArgument(
+                name="cache_dir",
+                description="Build cache directory (empty = GODOTAI_BUILD_CACHE_DIR or .build_cache)",
+                type=str,
+                required=False,
+                default=""
+            ),
+            ToolArgument(
+                name="jobs",
+                description="Parallel jobs (0 = auto-detect)",
+                type=int,
+                required=False,
+                default=0
+            ),
         ]
     
     def execute(self, args: Dict[str, Any]) -> int:
         """Execute the build-libgit2 tool."""
-        root_dir = self.get_root_dir()
+        root_dir = self.root_dir
         libgit2_dir = root_dir / "third_party" / "libgit2"
         build_dir = libgit2_dir / "build"
         
@@ -66,187 +101,110 @@ class BuildLibgit2Tool(BaseTool):
         
         config = args.get("config", "Release")
         should_clean = args.get("clean", False)
-        
-        print("\n" + "=" * 70)
-        print("Building libgit2")
-        print("=" * 70)
-        print(f"\n  Source: {libgit2_dir}")
-        print(f"  Config: {config}")
-        print(f"  Clean build: {should_clean}")
-        print()
+        unity = args.get("unity", False)
+        use_ccache = args.get("ccache", True)
+        jobs = args.get("jobs", 0)
+        cache_root = args.get("cache_dir", "")
+        
+        rule = "=" * 70
+        sys.stdout.write(
+            f"\n{rule}\n"
+            "Building libgit2\n"
+            f"{rule}\n"
+            f"\n  Source: {libgit2_dir}\n"
+            f"  Config: {config}\n"
+            f"  Clean build: {should_clean}\n"
+            f"  Unity build: {unity}\n\n"
+        )
+        sys.stdout.flush()
+        
+        # Reuse a library previously built from the same commit, options and toolchain
+        options = self._cmake_options(unity)
+        settings = self._configure_settings(build_dir, options, build_type=config, use_ccache=use_ccache)
+        cache_dir = self._artifact_cache_dir(root_dir, libgit2_dir, config, cache_root, settings)
+        if cache_dir is not None and not should_clean:
+            if self._restore_cached_library(root_dir, cache_dir):
+                sys.stdout.write(f"\n{rule}\n")
+                self.print_success("libgit2 restored from build cache!")
+                sys.stdout.write(f"{rule}\n")
+                sys.stdout.flush()
+                return 0
         
         # Clean if requested
-        if should_clean and build_dir.exists():
-            print("🧹 Cleaning build directory...")
-            shutil.rmtree(build_dir)
+        if should_clean:
+            self._clean_build_dir(build_dir)
         
-        # Create build directory
-        build_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Step 1: CMake Configure
-        if not self._cmake_configure(libgit2_dir, build_dir, config):
+        # Step 1: CMake Configure (libgit2's output is shown in full)
+        if not self._cmake_configure(libgit2_dir, build_dir, options,
+                                     build_type=config, use_ccache=use_ccache):
             return 1
         
         # Step 2: CMake Build
-        if not self._cmake_build(build_dir, config):
+        if not self._cmake_build(build_dir, config, jobs):
             return 1
         
         # Step 3: Copy library to build_ext_libs
-        if not self._copy_library(root_dir, build_dir, config):
+        lib_file = self._copy_library(root_dir, build_dir, config)
+        if not lib_file:
             return 1
         
-        print("\n" + "=" * 70)
+        if cache_dir is not None:
+            self._store_in_cache(lib_file, cache_dir)
+        
+        sys.stdout.write(f"\n{rule}\n")
         self.print_success("libgit2 built successfully!")
-        print("=" * 70)
+        sys.stdout.write(f"{rule}\n")
+        sys.stdout.flush()
         
         return 0
     
-    def _cmake_configure(self, source_dir: Path, build_dir: Path, config: str) -> bool:
+    def _cmake_options(self, unity: bool) -> List[str]:
         """
-        Run CMake configure step.
+        libgit2-specific CMake configure options.
         
         Args:
-            source_dir: libgit2 source directory
-            build_dir: Build directory
-            config: Build configuration (Debug/Release)
+            unity: Compile sources in batched unity translation units
             
         Returns:
-            True if successful
+            List of -D options
         """
-        print("⚙️  Configuring libgit2 with CMake...")
-        
-        cmake_args = [
-            "cmake",
-            "-S", str(source_dir),
-            "-B", str(build_dir),
-            f"-DCMAKE_BUILD_TYPE={config}",
+        return [
             "-DBUILD_SHARED_LIBS=OFF",  # Static library
             "-DUSE_SSH=OFF",            # No SSH support needed
             "-DUSE_HTTPS=OFF",          # No HTTPS needed for local repos
             "-DBUILD_TESTS=OFF",        # Don't build tests
             "-DBUILD_CLI=OFF",          # Don't build CLI tool (causes zlib errors)
             "-DTHREADSAFE=ON",          # Thread-safe operations
+            # Unity build batches many small C files per translation unit.
+            # Always passed so toggling it updates an existing CMakeCache.
+            f"-DCMAKE_UNITY_BUILD={'ON' if unity else 'OFF'}",
+            "-DCMAKE_UNITY_BUILD_BATCH_SIZE=16",
         ]
-        
-        # Platform-specific settings
-        import platform
-        if platform.system() == "Windows":
-            cmake_args.extend([
-                "-G", "Visual Studio 17 2022",
-                "-A", "x64"
-            ])
-        
-        try:
-            result = subprocess.run(
-                cmake_args,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            self.print_success("CMake configuration complete")
-            return True
-            
-        except subprocess.CalledProcessError as e:
-            self.print_error("CMake configuration failed")
-            print(f"\nStdout:\n{e.stdout}")
-            print(f"\nStderr:\n{e.stderr}")
-            return False
-        except FileNotFoundError:
-            self.print_error("CMake not found")
-            print("\nPlease install CMake:")
-            print("  - Windows: https://cmake.org/download/")
-            print("  - Linux: sudo apt install cmake")
-            print("  - macOS: brew install cmake")
-            return False
-    
-    def _cmake_build(self, build_dir: Path, config: str) -> bool:
-        """
-        Run CMake build step.
-        
-        Args:
-            build_dir: Build directory
-            config: Build configuration
-            
-        Returns:
-            True if successful
-        """
-        print("\n🔨 Building libgit2...")
-        
-        cmake_args = [
-            "cmake",
-            "--build", str(build_dir),
-            "--config", config,
-            "--parallel", "4"
-        ]
-        
-        try:
-            # Run build with real-time output
-            result = subprocess.run(
-                cmake_args,
-                cwd=build_dir,
-                text=True
-            )
-            
-            if result.returncode == 0:
-                self.print_success("libgit2 build complete")
-                return True
-            else:
-                self.print_error(f"Build failed with exit code {result.returncode}")
-                return False
-                
-        except Exception as e:
-            self.print_error(f"Build error: {e}")
-            return False
     
-    def _copy_library(self, root_dir: Path, build_dir: Path, config: str) -> bool:
+    def _find_lib(self, build_dir: Path, config: str) -> Optional[Path]:
         """
-        Copy built library to build_ext_libs.
+        Locate the built library with one directory read per location.
         
         Args:
-            root_dir: Repository root
             build_dir: Build directory
-            config: Build configuration
+            config: Build configuration (multi-config generators use a subdirectory)
             
         Returns:
-            True if successful
+            Path to the library, or None if it was not found
         """
-        print("\n📦 Copying library to build_ext_libs...")
-        
-        # Create output directory
-        output_dir = root_dir / "build_ext_libs"
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Find the library file
-        # Windows: git2.lib in build/<Config>/
-        # Linux/Mac: libgit2.a in build/
-        
-        lib_candidates = [
-            build_dir / config / "git2.lib",      # Windows
-            build_dir / "git2.lib",               # Windows alt
-            build_dir / config / "libgit2.a",     # Linux/Mac
-            build_dir / "libgit2.a",              # Linux/Mac alt
-        ]
-        
-        lib_file = None
-        for candidate in lib_candidates:
-            if candidate.exists():
-                lib_file = candidate
-                break
-        
-        if not lib_file:
-            self.print_error("Could not find built library")
-            print("\nSearched for:")
-            for candidate in lib_candidates:
-                print(f"  - {candidate}")
-            return False
-        
-        # Copy to output directory
-        output_file = output_dir / lib_file.name
-        shutil.copy2(lib_file, output_file)
-        
-        size_kb = output_file.stat().st_size / 1024
-        self.print_success(f"Copied {lib_file.name} ({size_kb:.1f} KB)")
-        print(f"  Location: {output_file}")
-        
-        return True
\ No newline at end of file
+        search_dirs = [build_dir / config, build_dir]
+        listings = []
+        for directory in search_dirs:
+            try:
+                with os.scandir(directory) as entries:
+                    listings.append({entry.name for entry in entries})
+            except OSError:
+                listings.append(set())
+        
+        # Windows name first, config subdirectory before the build root
+        for lib_name in _LIB_NAMES:
+            for directory, names in zip(search_dirs, listings):
+                if lib_name in names:
+                    return directory / lib_name
+        
+        return None
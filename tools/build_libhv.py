@@ -5,17 +5,40 @@ Builds the libhv HTTP/event library using CMake.
 The built library will be used for the HTTP/SSE server in Phase 4.
 """
 
-import subprocess
-import shutil
+import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
-from tools.base_tool import BaseTool, ToolArgument
+from tools.base_tool import ToolArgument
+from tools.cmake_base import CMakeBuildTool
 
 
-class BuildLibhvTool(BaseTool):
+# Library file names produced by the libhv build, in order of preference
+_LIB_NAMES = ("hv_static.lib", "libhv_static.a", "libhv.a")
+
+# libhv-specific CMake configure options
+_CMAKE_OPTIONS = (
+    "-DBUILD_SHARED=OFF",  # Static library
+    "-DBUILD_STATIC=ON",
+    "-DWITH_OPENSSL=OFF",  # We don't need SSL for local HTTP
+    "-DWITH_NGHTTP2=OFF",  # We don't need HTTP/2
+    "-DWITH_KCP=OFF",      # We don't need KCP protocol
+    "-DWITH_MQTT=OFF",
+    "-DBUILD_EXAMPLES=OFF",
+    "-DBUILD_UNITTEST=OFF",
+    # Skip probing for optional packages we never link against
+    "-DCMAKE_DISABLE_FIND_PACKAGE_ZLIB=ON",
+    "-DCMAKE_DISABLE_FIND_PACKAGE_CURL=ON",
+    "-DCMAKE_DISABLE_FIND_PACKAGE_c-ares=ON",
+)
+
+
+class BuildLibhvTool(CMakeBuildTool):
     """Build the libhv HTTP library."""
     
+    project_label = "libhv"
+    library_names = _LIB_NAMES
+    
     @property
     def name(self) -> str:
         return "build-libhv"
@@ -32,8 +55,7 @@ class BuildLibhvTool(BaseTool):
     def visible(self) -> bool:
         return False  # Hidden from main menu, called by build orchestrator
     
-    @property
-    def arguments(self):
+    def _define_arguments(self):
         return [
             ToolArgument(
                 name="config",
@@ -50,11 +72,32 @@ class BuildLibhvTool(BaseTool):
                 required=False,
                 default=False
             ),
+            ToolArgument(
+                name="ccache",
+                description="Use sccache/ccache when installed",
+                type=bool,
+                required=False,
+                default=True
+            ),
+            ToolArgument(
+                name="cache_dir",
+                description="Build cache directory (empty = GODOTAI_BUILD_CACHE_DIR or .build_cache)",
+                type=str,
+                required=False,
+                default=""
+            ),
+            ToolArgument(
+                name="jobs",
+                description="Parallel jobs (0 = auto-detect)",
+                type=int,
+                required=False,
+                default=0
+            ),
         ]
     
     def execute(self, args: Dict[str, Any]) -> int:
         """Execute the build-libhv tool."""
-        root_dir = self.get_root_dir()
+        root_dir = self.root_dir
         libhv_dir = root_dir / "third_party" / "libhv"
         build_dir = libhv_dir / "build"
         
@@ -66,6 +109,9 @@ class BuildLibhvTool(BaseTool):
         
         config = args.get("config", "Release")
         should_clean = args.get("clean", False)
+        use_ccache = args.get("ccache", True)
+        jobs = args.get("jobs", 0)
+        cache_root = args.get("cache_dir", "")
         
         print("\n" + "=" * 70)
         print("Building libhv")
@@ -75,180 +121,76 @@ class BuildLibhvTool(BaseTool):
         print(f"  Clean build: {should_clean}")
         print()
         
-        # Clean if requested
-        if should_clean and build_dir.exists():
-            print("🧹 Cleaning build directory...")
-            shutil.rmtree(build_dir)
+        # Reuse a library previously built from the same commit, options and toolchain
+        options = list(_CMAKE_OPTIONS)
+        settings = self._configure_settings(build_dir, options, build_type=config, use_ccache=use_ccache)
+        cache_dir = self._artifact_cache_dir(root_dir, libhv_dir, config, cache_root, settings)
+        if cache_dir is not None and not should_clean:
+            if self._restore_cached_library(root_dir, cache_dir):
+                print("\n" + "=" * 70)
+                self.print_success("libhv restored from build cache!")
+                print("=" * 70)
+                return 0
         
-        # Create build directory
-        build_dir.mkdir(parents=True, exist_ok=True)
+        # Clean if requested
+        if should_clean:
+            self._clean_build_dir(build_dir)
         
-        # Step 1: CMake Configure
-        if not self._cmake_configure(libhv_dir, build_dir, config):
+        # Step 1: CMake Configure (output is only shown if it fails)
+        if not self._cmake_configure(libhv_dir, build_dir, options,
+                                     build_type=config, use_ccache=use_ccache,
+                                     echo=lambda line: False):
             return 1
         
         # Step 2: CMake Build
-        if not self._cmake_build(build_dir, config):
+        if not self._cmake_build(build_dir, config, jobs):
             return 1
         
         # Step 3: Copy library to build_ext_libs
-        if not self._copy_library(root_dir, build_dir, config):
+        lib_file = self._copy_library(root_dir, build_dir, config)
+        if not lib_file:
             return 1
         
+        if cache_dir is not None:
+            self._store_in_cache(lib_file, cache_dir)
+        
         print("\n" + "=" * 70)
         self.print_success("libhv built successfully!")
         print("=" * 70)
         
         return 0
     
-    def _cmake_configure(self, source_dir: Path, build_dir: Path, config: str) -> bool:
-        """
-        Run CMake configure step.
-        
-        Args:
-            source_dir: libhv source directory
-            build_dir: Build directory
-            config: Build configuration (Debug/Release)
-            
-        Returns:
-            True if successful
+    def _find_lib(self, build_dir: Path, config: str) -> Optional[Path]:
         """
-        print("⚙️  Configuring libhv with CMake...")
-        
-        cmake_args = [
-            "cmake",
-            "-S", str(source_dir),
-            "-B", str(build_dir),
-            f"-DCMAKE_BUILD_TYPE={config}",
-            "-DBUILD_SHARED=OFF",  # Static library
-            "-DBUILD_STATIC=ON",
-            "-DWITH_OPENSSL=OFF",  # We don't need SSL for local HTTP
-            "-DWITH_NGHTTP2=OFF",  # We don't need HTTP/2
-            "-DWITH_KCP=OFF",      # We don't need KCP protocol
-        ]
+        Locate the built library under build/lib in a single directory walk.
         
-        # Platform-specific settings
-        import platform
-        if platform.system() == "Windows":
-            # Use Visual Studio generator on Windows
-            cmake_args.extend([
-                "-G", "Visual Studio 17 2022",
-                "-A", "x64"
-            ])
-        
-        try:
-            result = subprocess.run(
-                cmake_args,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            self.print_success("CMake configuration complete")
-            return True
-            
-        except subprocess.CalledProcessError as e:
-            self.print_error("CMake configuration failed")
-            print(f"\nStdout:\n{e.stdout}")
-            print(f"\nStderr:\n{e.stderr}")
-            return False
-        except FileNotFoundError:
-            self.print_error("CMake not found")
-            print("\nPlease install CMake:")
-            print("  - Windows: https://cmake.org/download/")
-            print("  - Linux: sudo apt install cmake")
-            print("  - macOS: brew install cmake")
-            return False
-    
-    def _cmake_build(self, build_dir: Path, config: str) -> bool:
-        """
-        Run CMake build step.
+        Any configuration subdirectory is accepted (e.g. RelWithDebInfo).
+        For each library name the requested config is preferred, then lib/.
         
         Args:
             build_dir: Build directory
             config: Build configuration
             
         Returns:
-            True if successful
+            Path to the library, or None if it was not found
         """
-        print("\n🔨 Building libhv...")
-        
-        cmake_args = [
-            "cmake",
-            "--build", str(build_dir),
-            "--config", config,
-            "--parallel", "4"
-        ]
-        
-        try:
-            # Run build with real-time output
-            result = subprocess.run(
-                cmake_args,
-                cwd=build_dir,
-                text=True
-            )
-            
-            if result.returncode == 0:
-                self.print_success("libhv build complete")
-                return True
+        lib_dir = build_dir / "lib"
+        candidates = []
+        for dirpath, _, filenames in os.walk(lib_dir):
+            for filename in filenames:
+                if filename in _LIB_NAMES:
+                    candidates.append(Path(dirpath) / filename)
+        
+        if not candidates:
+            return None
+        
+        def rank(path: Path):
+            if path.parent.name == config:
+                location = 0
+            elif path.parent == lib_dir:
+                location = 1
             else:
-                self.print_error(f"Build failed with exit code {result.returncode}")
-                return False
-                
-        except Exception as e:
-            self.print_error(f"Build error: {e}")
-            return False
-    
-    def _copy_library(self, root_dir: Path, build_dir: Path, config: str) -> bool:
-        """
-        Copy built library to build_ext_libs.
-        
-        Args:
-            root_dir: Repository root
-            build_dir: Build directory
-            config: Build configuration
-            
-        Returns:
-            True if successful
-        """
-        print("\n📦 Copying library to build_ext_libs...")
-        
-        # Create output directory
-        output_dir = root_dir / "build_ext_libs"
-        output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Find the library file
-        # Windows: hv_static.lib in build/lib/<Config>/
-        # Linux/Mac: libhv_static.a in build/lib/
-        
-        lib_candidates = [
-            build_dir / "lib" / config / "hv_static.lib",  # Windows
-            build_dir / "lib" / "hv_static.lib",            # Windows alt
-            build_dir / "lib" / config / "libhv_static.a",  # Linux/Mac
-            build_dir / "lib" / "libhv_static.a",           # Linux/Mac alt
-            build_dir / "lib" / config / "libhv.a",         # Alternative name
-            build_dir / "lib" / "libhv.a",                  # Alternative name
-        ]
-        
-        lib_file = None
-        for candidate in lib_candidates:
-            if candidate.exists():
-                lib_file = candidate
-                break
-        
-        if not lib_file:
-            self.print_error("Could not find built library")
-            print("\nSearched for:")
-            for candidate in lib_candidates:
-                print(f"  - {candidate}")
-            return False
-        
-        # Copy to output directory
-        output_file = output_dir / lib_file.name
-        shutil.copy2(lib_file, output_file)
-        
-        size_kb = output_file.stat().st_size / 1024
-        self.print_success(f"Copied {lib_file.name} ({size_kb:.1f} KB)")
-        print(f"  Location: {output_file}")
+                location = 2
+            return _LIB_NAMES.index(path.name), location
         
-        return True
\ No newline at end of file
+        return min(candidates, key=rank)
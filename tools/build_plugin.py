@@ -5,18 +5,40 @@ Compiles the GDExtension using CMake with godot-cpp integration.
 This replaces the SCons-based build system to avoid Python 3.13+ compatibility issues.
 """
 
-import subprocess
-import shutil
+import os
+import platform as platform_module
+import re
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List
 
-from tools.base_tool import BaseTool, ToolArgument
+from tools.base_tool import ToolArgument, resolve_exe
+from tools.cmake_base import CMakeBuildTool
 from tools.config import BuildConfig
 
 
-class BuildPluginTool(BaseTool):
+_SYSTEM = platform_module.system()
+_IS_WINDOWS = _SYSTEM == "Windows"
+
+# Configure output lines worth showing (warnings, found packages, our messages)
+_CONFIGURE_FILTER = re.compile(r"warning|found|godotai", re.IGNORECASE)
+
+# File extension of the plugin library on this platform
+_PLUGIN_LIB_SUFFIX = {"Windows": ".dll", "Darwin": ".dylib"}.get(_SYSTEM, ".so")
+
+# Paths whose presence CMakeLists.txt checks to enable libgit2/libhv support
+_OPTIONAL_DEPENDENCY_PATHS = (
+    "third_party/libgit2/include",
+    "third_party/libhv/include",
+    "build_ext_libs/git2.lib" if _IS_WINDOWS else "build_ext_libs/libgit2.a",
+    "build_ext_libs/hv_static.lib" if _IS_WINDOWS else "build_ext_libs/libhv_static.a",
+)
+
+
+class BuildPluginTool(CMakeBuildTool):
     """Build the GodotAI plugin using CMake."""
     
+    project_label = "GodotAI"
+    
     @property
     def name(self) -> str:
         return "build-plugin"
@@ -33,8 +55,7 @@ class BuildPluginTool(BaseTool):
     def description(self) -> str:
         return "Build the GodotAI plugin library using CMake"
     
-    @property
-    def arguments(self):
+    def _define_arguments(self):
         return [
             ToolArgument(
                 name="platform",
@@ -82,6 +103,13 @@ class BuildPluginTool(BaseTool):
                 required=False,
                 default=False
             ),
+            ToolArgument(
+                name="ccache",
+                description="Use sccache/ccache when installed",
+                type=bool,
+                required=False,
+                default=True
+            ),
             ToolArgument(
                 name="install",
                 description="Copy built library to plugin staging directory",
@@ -93,7 +121,7 @@ class BuildPluginTool(BaseTool):
     
     def execute(self, args: Dict[str, Any]) -> int:
         """Execute the CMake build tool."""
-        root_dir = self.get_root_dir()
+        root_dir = self.root_dir
         build_config = BuildConfig(root_dir)
         
         # Check if initialized
@@ -112,6 +140,7 @@ class BuildPluginTool(BaseTool):
         jobs = args.get("jobs") or config.get("jobs", 0)
         should_clean = args.get("clean", False)
         should_install = args.get("install", True)
+        use_ccache = args.get("ccache", True)
         
         # Force editor target (this is an editor-only plugin)
         target = "editor"
@@ -136,25 +165,31 @@ class BuildPluginTool(BaseTool):
         build_dir = root_dir / "build" / "cmake"
         
         # Clean if requested
-        if should_clean and build_dir.exists():
-            print("🧹 Cleaning build directory...")
-            shutil.rmtree(build_dir)
+        if should_clean:
+            self._clean_build_dir(build_dir)
             print()
         
-        # Create build directory
-        build_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Step 1: CMake Configure
-        if not self._cmake_configure(root_dir, build_dir, target, architecture, precision):
+        # Step 1: CMake Configure (warnings and important messages only)
+        options = [
+            "-DCMAKE_EXPORT_COMPILE_COMMANDS=ON",
+            f"-DGODOTAI_BUILD_TYPE={target}",
+            f"-DGODOTAI_PRECISION={precision}",
+        ]
+        # Visual Studio takes the architecture via -A (Ninja takes it from the MSVC environment)
+        vs_platform = {"x86_64": "x64", "x86_32": "Win32", "arm64": "ARM64"}.get(architecture)
+        build_type = "Debug" if "debug" in target.lower() else "Release"
+        if not self._cmake_configure(root_dir, build_dir, options,
+                                     build_type=build_type, vs_platform=vs_platform,
+                                     use_ccache=use_ccache, echo=_CONFIGURE_FILTER.search):
             return 1
         
         # Step 2: CMake Build
-        if not self._cmake_build(build_dir, jobs):
+        if not self._cmake_build(build_dir, "Release", jobs):
             return 1
         
         # Step 3: Install (optional)
         if should_install:
-            if not self._cmake_install(build_dir):
+            if not self._cmake_install(root_dir, build_dir, platform):
                 return 1
         
         # Step 4: Generate gdai.gdextension file
@@ -173,19 +208,24 @@ class BuildPluginTool(BaseTool):
         
         return 0
     
+    def configure_inputs(self, source_dir: Path) -> List[str]:
+        """
+        Presence of the optional dependencies CMakeLists.txt probes.
+        
+        Building or cleaning libgit2/libhv changes GODOTAI_HAS_LIBGIT2/LIBHV,
+        so the plugin has to be reconfigured when these appear or disappear.
+        
+        Args:
+            source_dir: Project source directory (repository root)
+            
+        Returns:
+            One "path=0|1" entry per probed path
+        """
+        return [f"{path}={int((source_dir / path).exists())}" for path in _OPTIONAL_DEPENDENCY_PATHS]
+    
     def _auto_detect_platform(self) -> str:
         """Auto-detect the current platform."""
-        import platform
-        system = platform.system()
-        
-        if system == "Windows":
-            return "windows"
-        elif system == "Linux":
-            return "linux"
-        elif system == "Darwin":
-            return "macos"
-        else:
-            return "unknown"
+        return {"Windows": "windows", "Linux": "linux", "Darwin": "macos"}.get(_SYSTEM, "unknown")
     
     def _check_dependencies(self, root_dir: Path) -> bool:
         """
@@ -206,180 +246,80 @@ class BuildPluginTool(BaseTool):
         
         return True
     
-    def _cmake_configure(self, root_dir: Path, build_dir: Path, 
-                        target: str, architecture: str, precision: str) -> bool:
+    def _cmake_install(self, root_dir: Path, build_dir: Path, platform: str) -> bool:
         """
-        Run CMake configure step.
+        Run CMake install step.
+        
+        Skipped when plugin/bin already holds the current build output.
         
         Args:
             root_dir: Repository root
             build_dir: Build directory
-            target: Build target (template_debug/template_release/editor)
-            architecture: Target architecture
-            precision: Floating-point precision
+            platform: Target platform (plugin/bin subdirectory)
             
         Returns:
             True if successful
         """
-        print("⚙️  Configuring with CMake...")
-        
-        cmake_args = [
-            "cmake",
-            "-S", str(root_dir),
-            "-B", str(build_dir),
-            f"-DCMAKE_EXPORT_COMPILE_COMMANDS=ON",
-            f"-DGODOTAI_BUILD_TYPE={target}",
-            f"-DGODOTAI_PRECISION={precision}",
-        ]
-        
-        # Platform-specific generator
-        import platform
-        if platform.system() == "Windows":
-            # Use Visual Studio generator on Windows
-            cmake_args.extend([
-                "-G", "Visual Studio 17 2022",
-            ])
-            
-            # Set architecture for VS
-            arch_map = {
-                "x86_64": "x64",
-                "x86_32": "Win32",
-                "arm64": "ARM64",
-            }
-            if architecture in arch_map:
-                cmake_args.extend(["-A", arch_map[architecture]])
-        
-        # Multi-config generators (Visual Studio, Xcode) don't use CMAKE_BUILD_TYPE
-        # Single-config generators (Ninja, Unix Makefiles) require it
-        if platform.system() != "Windows":
-            # Map target to CMake build type
-            cmake_build_type = "Release"
-            if "debug" in target.lower():
-                cmake_build_type = "Debug"
-            
-            cmake_args.append(f"-DCMAKE_BUILD_TYPE={cmake_build_type}")
-        
-        print(f"Command: {' '.join(cmake_args)}\n")
+        print("\n📦 Installing to plugin/bin...")
         
-        try:
-            result = subprocess.run(
-                cmake_args,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            # Show warnings and important messages
-            if result.stdout:
-                for line in result.stdout.split('\n'):
-                    if 'warning' in line.lower() or 'found' in line.lower() or 'godotai' in line.lower():
-                        print(line)
-            
-            self.print_success("CMake configuration complete")
+        if self._install_is_current(build_dir / "bin", root_dir / "plugin" / "bin" / platform):
+            self.print_success("Installation up to date")
             return True
-            
-        except subprocess.CalledProcessError as e:
-            self.print_error("CMake configuration failed")
-            print(f"\nStdout:\n{e.stdout}")
-            print(f"\nStderr:\n{e.stderr}")
-            return False
-        except FileNotFoundError:
-            self.print_error("CMake not found")
-            print("\nPlease install CMake:")
-            print("  - Windows: https://cmake.org/download/")
-            print("  - Linux: sudo apt install cmake")
-            print("  - macOS: brew install cmake")
-            return False
-    
-    def _cmake_build(self, build_dir: Path, jobs: int) -> bool:
-        """
-        Run CMake build step.
-        
-        Args:
-            build_dir: Build directory
-            jobs: Number of parallel jobs (0 = auto)
-            
-        Returns:
-            True if successful
-        """
-        print("\n🔨 Building GodotAI...")
         
         cmake_args = [
-            "cmake",
-            "--build", str(build_dir),
+            resolve_exe("cmake"),
+            "--install", str(build_dir),
         ]
         
         # On multi-config generators, specify the config
-        import platform
-        if platform.system() == "Windows":
+        if _IS_WINDOWS:
             cmake_args.extend(["--config", "Release"])
         
-        # Add parallelism
-        if jobs > 0:
-            cmake_args.extend(["--parallel", str(jobs)])
-        else:
-            # Let CMake decide based on CPU cores
-            cmake_args.append("--parallel")
-        
-        print(f"Command: {' '.join(cmake_args)}\n")
+        # Install output is only shown if it fails
+        returncode, tail = self.run_streamed(cmake_args, echo=lambda line: False)
         
-        try:
-            # Run build with real-time output
-            result = subprocess.run(
-                cmake_args,
-                cwd=build_dir,
-                text=True
-            )
-            
-            if result.returncode == 0:
-                print()
-                self.print_success("Build complete")
-                return True
-            else:
-                self.print_error(f"Build failed with exit code {result.returncode}")
-                return False
-                
-        except Exception as e:
-            self.print_error(f"Build error: {e}")
+        if returncode != 0:
+            self.print_error("Installation failed")
+            print(f"\nOutput:\n{''.join(tail)}")
             return False
+        
+        self.print_success("Installation complete")
+        return True
     
-    def _cmake_install(self, build_dir: Path) -> bool:
+    def _install_is_current(self, bin_dir: Path, install_dir: Path) -> bool:
         """
-        Run CMake install step.
+        Check whether every built plugin library is already installed.
+        
+        An installed copy counts as current when it has the same size and
+        is at least as new as the built file (CMake keeps the timestamp).
         
         Args:
-            build_dir: Build directory
+            bin_dir: Build output directory (build/cmake/bin)
+            install_dir: Install directory (plugin/bin/<platform>)
             
         Returns:
-            True if successful
+            True if there is nothing to install
         """
-        print("\n📦 Installing to plugin/bin...")
+        try:
+            with os.scandir(bin_dir) as entries:
+                built = [entry for entry in entries
+                         if entry.is_file() and entry.name.endswith(_PLUGIN_LIB_SUFFIX)]
+        except OSError:
+            return False
         
-        cmake_args = [
-            "cmake",
-            "--install", str(build_dir),
-        ]
+        if not built:
+            return False
         
-        # On multi-config generators, specify the config
-        import platform
-        if platform.system() == "Windows":
-            cmake_args.extend(["--config", "Release"])
+        for entry in built:
+            try:
+                installed = (install_dir / entry.name).stat()
+            except OSError:
+                return False
+            source = entry.stat()
+            if installed.st_size != source.st_size or installed.st_mtime < source.st_mtime:
+                return False
         
-        try:
-            result = subprocess.run(
-                cmake_args,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            self.print_success("Installation complete")
-            return True
-            
-        except subprocess.CalledProcessError as e:
-            self.print_error("Installation failed")
-            print(f"\nStderr:\n{e.stderr}")
-            return False
+        return True
     
     def _show_build_summary(self, root_dir: Path, build_dir: Path, 
                            target: str, platform: str, installed: bool):
@@ -401,24 +341,34 @@ class BuildPluginTool(BaseTool):
         bin_dir = build_dir / "bin"
         if bin_dir.exists():
             print("\n📄 Built files in build/cmake/bin:")
-            for file in bin_dir.iterdir():
-                if file.is_file():
-                    size_kb = file.stat().st_size / 1024
-                    print(f"  - {file.name} ({size_kb:.1f} KB)")
+            self._print_file_sizes(bin_dir)
         
         # Check installed files
         if installed:
             plugin_bin = root_dir / "plugin" / "bin"
             if plugin_bin.exists():
                 print("\n📦 Installed files in plugin/bin:")
-                for file in plugin_bin.iterdir():
-                    if file.is_file():
-                        size_kb = file.stat().st_size / 1024
-                        print(f"  - {file.name} ({size_kb:.1f} KB)")
+                self._print_file_sizes(plugin_bin)
         
         # Show next steps
         print("\n💡 Next steps:")
         if not installed:
             print("  1. Run 'build' again with install=True to copy to plugin/bin")
         print("  2. Copy plugin/ directory to your Godot project's addons/")
-        print("  3. Enable the plugin in Godot's Project Settings")
\ No newline at end of file
+        print("  3. Enable the plugin in Godot's Project Settings")
+    
+    def _print_file_sizes(self, directory: Path) -> None:
+        """
+        Print the name and size of each file in a directory.
+        
+        Uses os.scandir so the file check and size come from a single
+        directory read instead of separate stat calls per file.
+        
+        Args:
+            directory: Directory to list
+        """
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    size_kb = entry.stat().st_size / 1024
+                    print(f"  - {entry.name} ({size_kb:.1f} KB)")
@@ -6,9 +6,13 @@ This tool is designed to be called by CI systems and is hidden from
 the interactive menu.
 """
 
+import hashlib
+import os
 import platform as platform_module
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, Any, List
-from tools.base_tool import BaseTool, ToolArgument
+from tools.base_tool import BaseTool, BuildJob, ToolArgument, detect_jobs, prefixed_output
 
 
 class CIBuildTool(BaseTool):
@@ -31,8 +35,7 @@ class CIBuildTool(BaseTool):
         # Hidden from interactive menu - only for CI use
         return True
     
-    @property
-    def arguments(self) -> List[ToolArgument]:
+    def _define_arguments(self) -> List[ToolArgument]:
         return [
             ToolArgument(
                 name="godot_version",
@@ -87,6 +90,20 @@ class CIBuildTool(BaseTool):
                 required=False,
                 default=False
             ),
+            ToolArgument(
+                name="cache_dir",
+                description="Build cache directory (empty = GODOTAI_BUILD_CACHE_DIR or .build_cache)",
+                type=str,
+                required=False,
+                default=""
+            ),
+            ToolArgument(
+                name="parallel_deps",
+                description="Build libgit2 and libhv concurrently (disable for debugging)",
+                type=bool,
+                required=False,
+                default=True
+            ),
             ToolArgument(
                 name="verbose",
                 description="Verbose build output",
@@ -108,6 +125,9 @@ class CIBuildTool(BaseTool):
         print(f"Build Type: {args.get('build_type', 'Release')}")
         print("=" * 70)
         
+        # Let the workflow save build directories under a matching cache key
+        self._export_cache_key(args)
+        
         # Step 1: Initialize (unless skipped)
         if not args.get("skip_init", False):
             print("\n[1/4] Initializing project...")
@@ -127,27 +147,15 @@ class CIBuildTool(BaseTool):
         
         # Step 2: Build dependencies (unless skipped)
         if not args.get("skip_deps", False):
-            build_type = args.get("build_type", "Release")
-            
-            print("\n[2/4] Building libgit2...")
-            result = self.execute_tool("build-libgit2", {
-                "config": build_type,  # Use 'config' not 'build_type'
-                "clean": False
-            })
+            parallel = args.get("parallel_deps", True)
+            if parallel:
+                print("\n[2-3/4] Building libgit2 and libhv concurrently...")
+            else:
+                print("\n[2-3/4] Building libgit2 and libhv...")
+            result = self._build_dependencies(args.get("build_type", "Release"), parallel,
+                                              args.get("cache_dir", ""))
             if result != 0:
-                self.print_error("libgit2 build failed")
                 return result
-            print("✅ libgit2 build complete")
-            
-            print("\n[3/4] Building libhv...")
-            result = self.execute_tool("build-libhv", {
-                "config": build_type,  # Use 'config' not 'build_type'
-                "clean": False
-            })
-            if result != 0:
-                self.print_error("libhv build failed")
-                return result
-            print("✅ libhv build complete")
         else:
             print("\n[2/4] ⏭️  Skipping dependencies...")
             print("[3/4] ⏭️  Skipping dependencies...")
@@ -176,17 +184,136 @@ class CIBuildTool(BaseTool):
         print("=" * 70)
         
         # Show where artifacts are
-        root_dir = self.get_root_dir()
+        root_dir = self.root_dir
         plugin_bin = root_dir / "plugin" / "bin"
         
         if plugin_bin.exists():
-            print("\n📦 Built artifacts:")
-            for platform_dir in plugin_bin.iterdir():
-                if platform_dir.is_dir():
-                    print(f"  Platform: {platform_dir.name}")
-                    for lib_file in platform_dir.iterdir():
-                        if lib_file.is_file():
-                            size_mb = lib_file.stat().st_size / (1024 * 1024)
-                            print(f"    - {lib_file.name} ({size_mb:.2f} MB)")
-        
-        return 0
\ No newline at end of file
+            lines = ["\n📦 Built artifacts:"]
+            with os.scandir(plugin_bin) as platform_dirs:
+                for platform_dir in platform_dirs:
+                    if not platform_dir.is_dir():
+                        continue
+                    lines.append(f"  Platform: {platform_dir.name}")
+                    with os.scandir(platform_dir.path) as lib_files:
+                        for lib_file in lib_files:
+                            if lib_file.is_file():
+                                size_mb = lib_file.stat().st_size / (1024 * 1024)
+                                lines.append(f"    - {lib_file.name} ({size_mb:.2f} MB)")
+            print("\n".join(lines))
+        
+        return 0
+    
+    def _export_cache_key(self, args: Dict[str, Any]) -> str:
+        """
+        Publish a cache key for this build as the GitHub Actions output ``cache-key``.
+        
+        The key covers the build options and the checked-out submodule
+        commits, so a build directory restored under it was configured
+        for the same sources and settings. Nothing is written outside
+        GitHub Actions (GITHUB_OUTPUT unset).
+        
+        Args:
+            args: ci-build arguments
+            
+        Returns:
+            The cache key
+        """
+        parts = [
+            "godotai-build",
+            {"Windows": "windows", "Darwin": "macos"}.get(platform_module.system(), "linux"),
+            args.get("arch", "x86_64"),
+            args.get("target", "editor"),
+            args.get("build_type", "Release"),
+            args.get("precision", "single"),
+            args.get("godot_version", "4.4"),
+        ]
+        
+        try:
+            submodules = subprocess.run(
+                ["git", "submodule", "status", "--recursive"],
+                cwd=self.root_dir, capture_output=True, text=True
+            ).stdout
+        except FileNotFoundError:
+            submodules = ""
+        parts.append(hashlib.sha256(submodules.encode()).hexdigest()[:16])
+        
+        key = "-".join(parts)
+        
+        github_output = os.environ.get("GITHUB_OUTPUT")
+        if github_output:
+            with open(github_output, "a", encoding="utf-8") as f:
+                f.write(f"cache-key={key}\n")
+        
+        print(f"Cache key: {key}")
+        return key
+    
+    def _build_dependencies(self, build_type: str, parallel: bool = True,
+                            cache_dir: str = "") -> int:
+        """
+        Build libgit2 and libhv, by default at the same time.
+        
+        The two libraries are independent, so each gets half of the CPUs
+        instead of running one after the other.
+        
+        Args:
+            build_type: CMake build type for both libraries
+            parallel: If False, build one after the other with all CPUs
+            cache_dir: Build cache directory passed to both builds
+            
+        Returns:
+            0 if both built, otherwise the first failing exit code
+            (a failure cancels the other build)
+        """
+        dependencies = {"build-libgit2": "libgit2", "build-libhv": "libhv"}
+        
+        if not parallel:
+            for tool_name, label in dependencies.items():
+                result = self.execute_tool(tool_name, {
+                    "config": build_type,
+                    "clean": False,
+                    "jobs": 0,
+                    "cache_dir": cache_dir
+                })
+                if result != 0:
+                    self.print_error(f"{label} build failed")
+                    return result
+                print(f"✅ {label} build complete")
+            return 0
+        
+        jobs = max(1, detect_jobs() // 2)
+        failure = 0
+        
+        # The builds run external processes, so threads are enough.
+        # Each build's output lines are prefixed with its library name.
+        with prefixed_output(), ThreadPoolExecutor(max_workers=len(dependencies)) as executor:
+            futures = {}
+            for tool_name, label in dependencies.items():
+                job = BuildJob(label)
+                futures[executor.submit(job.run, self.execute_tool, tool_name, {
+                    "config": build_type,  # Use 'config' not 'build_type'
+                    "clean": False,
+                    "jobs": jobs,
+                    "cache_dir": cache_dir
+                })] = job
+            
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    self.print_error(f"{job.label} build error: {e}")
+                    result = 1
+                
+                if result == 0:
+                    print(f"✅ {job.label} build complete")
+                elif job.cancelled.is_set():
+                    self.print_warning(f"{job.label} build cancelled")
+                else:
+                    self.print_error(f"{job.label} build failed")
+                    failure = failure or result
+                    # Fail fast: stop the other build instead of waiting for it
+                    for other in futures.values():
+                        if other is not job:
+                            other.cancel()
+        
+        return failure
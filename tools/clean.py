@@ -5,13 +5,22 @@ Removes build artifacts, intermediate files, and optionally configuration.
 Uses tools/config.json to determine what to clean.
 """
 
-import shutil
+import os
+import stat
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 
 from tools.base_tool import BaseTool, ToolArgument
 
 
+# Descriptor-relative removal (os.fwalk + dir_fd) is unavailable on Windows
+_HAVE_FWALK = (hasattr(os, "fwalk") and
+               {os.stat, os.unlink, os.rmdir} <= os.supports_dir_fd)
+
+
 class CleanTool(BaseTool):
     """Clean build artifacts and configuration."""
     
@@ -27,8 +36,7 @@ class CleanTool(BaseTool):
     def category(self) -> str:
         return "clean"
     
-    @property
-    def arguments(self):
+    def _define_arguments(self):
         return [
             ToolArgument(
                 name="target",
@@ -42,7 +50,7 @@ class CleanTool(BaseTool):
     
     def execute(self, args: Dict[str, Any]) -> int:
         """Execute the clean tool."""
-        root_dir = self.get_root_dir()
+        root_dir = self.root_dir
         target = args.get("target", "build")
         
         print("\n" + "=" * 70)
@@ -67,16 +75,18 @@ class CleanTool(BaseTool):
                 print("Clean cancelled")
                 return 0
         
-        # Get paths to clean
-        patterns = targets[target]
+        # Resolve every pattern first, then remove the matches concurrently
+        paths = []
+        for base_dir, glob_pattern in self.compiled_targets[target]:
+            for path in self._match_compiled(base_dir, glob_pattern):
+                if path not in paths:
+                    paths.append(path)
         
-        if not isinstance(patterns, list):
-            patterns = [patterns]
+        # Paths inside another match go with it (avoids racing deletions)
+        paths = [path for path in paths
+                 if not any(other in path.parents for other in paths)]
         
-        # Clean each pattern
-        cleaned_count = 0
-        for pattern in patterns:
-            cleaned_count += self._clean_pattern(root_dir, pattern)
+        cleaned_count = self._remove_paths(paths)
         
         # Summary
         print("\n" + "=" * 70)
@@ -88,82 +98,123 @@ class CleanTool(BaseTool):
         
         return 0
     
-    def _clean_pattern(self, root_dir: Path, pattern: str) -> int:
+    @cached_property
+    def compiled_targets(self) -> Dict[str, List[Tuple[Path, str]]]:
         """
-        Clean files/directories matching a pattern.
+        Clean patterns of every target, split once into (base_dir, glob).
+        
+        The base is the literal directory before the first wildcard; the
+        glob part is empty for patterns without wildcards.
         
-        Args:
-            root_dir: Repository root directory
-            pattern: Path pattern to clean (supports wildcards)
-            
         Returns:
-            Number of items cleaned
+            Dictionary of target name -> list of (base directory, glob pattern)
         """
-        cleaned = 0
+        root_dir = self.root_dir
+        compiled = {}
         
-        # Handle glob patterns
-        if '*' in pattern:
-            # Split pattern into parts
-            parts = Path(pattern).parts
-            base_parts = []
-            glob_parts = []
-            found_wildcard = False
-            
-            for part in parts:
-                if '*' in part or found_wildcard:
-                    glob_parts.append(part)
-                    found_wildcard = True
-                else:
-                    base_parts.append(part)
-            
-            if base_parts:
-                base_dir = root_dir / Path(*base_parts)
-            else:
-                base_dir = root_dir
+        for target, patterns in self.get_tool_config().get("targets", {}).items():
+            if not isinstance(patterns, list):
+                patterns = [patterns]
             
-            glob_pattern = str(Path(*glob_parts)) if glob_parts else '*'
+            compiled[target] = []
+            for pattern in patterns:
+                pattern = pattern.replace("\\", "/")
+                star = pattern.find('*')
+                if star < 0:
+                    compiled[target].append((root_dir / pattern, ""))
+                    continue
+                
+                slash = pattern.rfind('/', 0, star)
+                compiled[target].append((root_dir / pattern[:slash + 1], pattern[slash + 1:]))
+        
+        return compiled
+    
+    def _match_compiled(self, base_dir: Path, glob_pattern: str) -> List[Path]:
+        """
+        Find existing files/directories matching a compiled clean pattern.
+        
+        Args:
+            base_dir: Literal directory part of the pattern
+            glob_pattern: Wildcard part (empty for a direct path)
             
-            if not base_dir.exists():
-                return 0
+        Returns:
+            List of matching paths
+        """
+        # Direct path
+        if not glob_pattern:
+            return [base_dir] if base_dir.exists() else []
+        
+        # Skip the glob entirely when the base directory is missing or
+        # empty (the usual case on a fresh checkout)
+        try:
+            with os.scandir(base_dir) as entries:
+                if next(entries, None) is None:
+                    return []
+        except OSError:
+            return []
+        
+        # Path.glob handles patterns spanning several components (and **)
+        return list(base_dir.glob(glob_pattern))
+    
+    def _remove_paths(self, paths: List[Path]) -> int:
+        """
+        Remove several files/directories concurrently.
+        
+        Removal is dominated by filesystem syscalls, which release the GIL,
+        so independent paths are deleted on a thread pool. The removal
+        report is written in one go afterwards, in the order of paths.
+        
+        Args:
+            paths: Paths to remove
             
-            # Find matching paths
-            for path in base_dir.glob(glob_pattern):
-                if path.exists():
-                    if self._remove_path(path):
-                        cleaned += 1
+        Returns:
+            Number of items removed
+        """
+        logs: List[List[str]] = [[] for _ in paths]
+        
+        if len(paths) <= 1:
+            cleaned = sum(1 for path, log in zip(paths, logs) if self._remove_path(path, log))
         else:
-            # Direct path
-            path = root_dir / pattern
-            if path.exists():
-                if self._remove_path(path):
-                    cleaned += 1
+            workers = min(len(paths), (os.cpu_count() or 1) * 4, 32)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                cleaned = sum(executor.map(self._remove_path, paths, logs))
         
+        sys.stdout.write("".join(line for log in logs for line in log))
+        sys.stdout.flush()
         return cleaned
     
-    def _remove_path(self, path: Path) -> bool:
+    def _remove_path(self, path: Path, log: Optional[List[str]] = None) -> bool:
         """
         Remove a file or directory.
         
+        Directory sizes are added up while deleting, so the tree is
+        walked once and the size is reported afterwards.
+        
         Args:
             path: Path to remove
+            log: If given, the removal message is appended here instead of printed
             
         Returns:
             True if removed successfully
         """
         try:
-            if path.is_dir():
-                # Calculate size before removing
-                size = self._calculate_dir_size(path)
+            # One lstat gives both the type and the size (symlinks are removed, not followed)
+            info = path.lstat()
+            if stat.S_ISDIR(info.st_mode):
+                size = self._parallel_rmtree(path)
                 size_mb = size / (1024 * 1024)
-                
-                print(f"🗑️  Removing {path.name}/ ({size_mb:.1f} MB)...")
-                shutil.rmtree(path)
+                message = f"🗑️  Removed {path.name}/ ({size_mb:.1f} MB)\n"
             else:
-                size = path.stat().st_size
+                size = info.st_size
                 size_kb = size / 1024
                 
-                print(f"🗑️  Removing {path.name} ({size_kb:.1f} KB)...")
                 path.unlink()
+                message = f"🗑️  Removed {path.name} ({size_kb:.1f} KB)\n"
+            
+            if log is None:
+                sys.stdout.write(message)
+            else:
+                log.append(message)
             
             return True
             
@@ -171,24 +222,100 @@ class CleanTool(BaseTool):
             self.print_warning(f"Failed to remove {path}: {e}")
             return False
     
-    def _calculate_dir_size(self, directory: Path) -> int:
+    def _split_entries(self, directory: Path):
         """
-        Calculate total size of directory.
+        List a directory's immediate subdirectories and other entries.
         
         Args:
-            directory: Directory to calculate
+            directory: Directory to list
             
         Returns:
-            Total size in bytes
+            Tuple of (subdirectory paths, other entries as os.DirEntry)
         """
-        total = 0
-        try:
-            for entry in directory.rglob('*'):
-                if entry.is_file():
-                    total += entry.stat().st_size
-        except:
-            pass
-        return total
+        with os.scandir(directory) as entries:
+            entries = list(entries)
+        subdirs = [entry.path for entry in entries if entry.is_dir(follow_symlinks=False)]
+        others = [entry for entry in entries if not entry.is_dir(follow_symlinks=False)]
+        return subdirs, others
+    
+    def _walk_and_remove(self, top: str) -> int:
+        """
+        Remove a directory tree bottom-up, adding up file sizes on the way.
+        
+        Where the platform supports it (Linux, macOS), entries are removed
+        relative to an open descriptor of their parent directory, so the
+        kernel does not resolve the full path again for every file.
+        
+        Args:
+            top: Directory to remove
+            
+        Returns:
+            Bytes freed
+            
+        Raises:
+            OSError: If any entry cannot be listed or removed
+        """
+        def raise_error(error: OSError) -> None:
+            raise error
+        
+        freed = 0
+        
+        if _HAVE_FWALK:
+            for _, dirnames, filenames, dir_fd in os.fwalk(top, topdown=False, onerror=raise_error):
+                for filename in filenames:
+                    freed += os.stat(filename, dir_fd=dir_fd, follow_symlinks=False).st_size
+                    os.unlink(filename, dir_fd=dir_fd)
+                for dirname in dirnames:
+                    # Symlinks to directories are listed here but not descended into
+                    mode = os.stat(dirname, dir_fd=dir_fd, follow_symlinks=False).st_mode
+                    if stat.S_ISLNK(mode):
+                        os.unlink(dirname, dir_fd=dir_fd)
+                    else:
+                        os.rmdir(dirname, dir_fd=dir_fd)
+            os.rmdir(top)
+            return freed
+        
+        for dirpath, dirnames, filenames in os.walk(top, topdown=False, onerror=raise_error):
+            for filename in filenames:
+                file_path = os.path.join(dirpath, filename)
+                freed += os.lstat(file_path).st_size
+                os.unlink(file_path)
+            for dirname in dirnames:
+                # Symlinks to directories are listed here but not descended into
+                dir_path = os.path.join(dirpath, dirname)
+                if os.path.islink(dir_path):
+                    os.unlink(dir_path)
+                else:
+                    os.rmdir(dir_path)
+        os.rmdir(top)
+        return freed
+    
+    def _parallel_rmtree(self, directory: Path) -> int:
+        """
+        Remove a directory tree, deleting its top-level subtrees concurrently.
+        
+        Args:
+            directory: Directory to remove
+            
+        Returns:
+            Bytes freed
+        """
+        subdirs, others = self._split_entries(directory)
+        
+        freed = 0
+        for entry in others:
+            freed += entry.stat(follow_symlinks=False).st_size
+            os.unlink(entry.path)
+        
+        if len(subdirs) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(subdirs), os.cpu_count() or 1)) as executor:
+                # sum() re-raises the first failure
+                freed += sum(executor.map(self._walk_and_remove, subdirs))
+        else:
+            freed += sum(self._walk_and_remove(subdir) for subdir in subdirs)
+        
+        os.rmdir(directory)
+        return freed
     
     def clean_specific_paths(self, paths: List[str]) -> int:
         """
@@ -200,13 +327,6 @@ class CleanTool(BaseTool):
         Returns:
             Number of items cleaned
         """
-        root_dir = self.get_root_dir()
-        cleaned = 0
-        
-        for path_str in paths:
-            path = root_dir / path_str
-            if path.exists():
-                if self._remove_path(path):
-                    cleaned += 1
-        
-        return cleaned
\ No newline at end of file
+        root_dir = self.root_dir
+        existing = [root_dir / path_str for path_str in paths]
+        return self._remove_paths([path for path in existing if path.exists()])
\ No newline at end of file
@@ -0,0 +1,493 @@
+"""
+Shared base class for tools that build a CMake project.
+
+Handles the configure/build steps common to the libgit2, libhv and
+plugin builds: generator selection, compiler cache, job counts,
+skipping unchanged configures, copying built libraries and caching
+dependency libraries per source commit.
+"""
+
+import hashlib
+import os
+import platform
+import shutil
+import subprocess
+import sys
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from tools.base_tool import BaseTool, detect_jobs, resolve_exe
+
+
+_IS_WINDOWS = sys.platform == "win32"
+
+# File in a CMake build directory holding the hash of its configure arguments
+_CONFIGURE_STAMP = ".configure_args_hash"
+
+
+@lru_cache(maxsize=None)
+def find_compiler_cache() -> Optional[str]:
+    """
+    Locate a compiler cache (sccache preferred, then ccache) on PATH.
+    
+    Returns:
+        Full path to the compiler cache, or None if neither is installed
+    """
+    return shutil.which("sccache") or shutil.which("ccache")
+
+
+@lru_cache(maxsize=1)
+def toolchain_identity() -> Tuple[str, ...]:
+    """
+    Identify the C and C++ compilers CMake will pick up by default.
+    
+    Returns:
+        Tuple of (compiler path, first line of its version banner) per language
+    """
+    identity = []
+    for variable, default in (("CC", "cc"), ("CXX", "c++")):
+        compiler = resolve_exe(os.environ.get(variable) or ("cl" if _IS_WINDOWS else default))
+        # cl prints its banner (to stderr) when run without arguments
+        is_msvc = Path(compiler).stem.lower() == "cl"
+        try:
+            result = subprocess.run(
+                [compiler] if is_msvc else [compiler, "--version"],
+                capture_output=True, text=True, errors="replace"
+            )
+            banner = (result.stdout or result.stderr).strip()
+        except OSError:
+            banner = ""
+        identity += [compiler, banner.splitlines()[0] if banner else ""]
+    return tuple(identity)
+
+
+def _args_hash(args: List[str]) -> str:
+    """Stable hash of a command line."""
+    return hashlib.sha256("\0".join(args).encode()).hexdigest()
+
+
+class CMakeBuildTool(BaseTool):
+    """
+    Base class for tools that configure and build a CMake project.
+    
+    Subclasses still implement name, description and execute(), and call
+    the _cmake_configure/_cmake_build/_copy_library steps from it.
+    """
+    
+    # Project name used in progress messages (e.g. "libhv")
+    project_label = "project"
+    
+    # Library files a dependency build copies to build_ext_libs, in order of preference
+    library_names: Sequence[str] = ()
+    
+    def select_cmake_generator(self, build_dir: Path) -> Optional[str]:
+        """
+        Choose the CMake generator for a build directory.
+        
+        An already-configured build directory keeps its generator, since
+        CMake refuses to switch generators in place. Otherwise Ninja is
+        preferred when installed (on Windows it also needs the MSVC
+        environment, i.e. cl on PATH).
+        
+        Args:
+            build_dir: Build directory
+            
+        Returns:
+            Generator name, or None to use CMake's default
+        """
+        cache_file = build_dir / "CMakeCache.txt"
+        if cache_file.exists():
+            with open(cache_file, 'r', errors='replace') as f:
+                for line in f:
+                    if line.startswith("CMAKE_GENERATOR:INTERNAL="):
+                        return line.split("=", 1)[1].strip()
+        
+        if shutil.which("ninja") and (not _IS_WINDOWS or shutil.which("cl")):
+            return "Ninja"
+        
+        if _IS_WINDOWS:
+            return "Visual Studio 17 2022"
+        
+        return None
+    
+    def link_pool_args(self, generator: Optional[str]) -> List[str]:
+        """
+        CMake configure arguments limiting concurrent link steps under Ninja.
+        
+        Links are the most memory-hungry build steps, so running many of
+        them at once can exhaust RAM on small machines.
+        
+        Args:
+            generator: Generator chosen by select_cmake_generator()
+            
+        Returns:
+            List of -D arguments (empty for other generators)
+        """
+        if generator != "Ninja":
+            return []
+        return ["-DCMAKE_JOB_POOLS=link=2", "-DCMAKE_JOB_POOL_LINK=link"]
+    
+    def compiler_launcher_args(self, enabled: bool = True) -> List[str]:
+        """
+        CMake configure arguments that route compiles through a compiler cache.
+        
+        Visual Studio generators ignore compiler launchers, so these only
+        help with Ninja and Makefile generators.
+        
+        Args:
+            enabled: If False, clear any launcher left in an existing CMakeCache
+            
+        Returns:
+            List of -D arguments (launcher is empty when disabled or not installed)
+        """
+        launcher = (find_compiler_cache() if enabled else None) or ""
+        return [
+            f"-DCMAKE_C_COMPILER_LAUNCHER={launcher}",
+            f"-DCMAKE_CXX_COMPILER_LAUNCHER={launcher}",
+        ]
+    
+    def configure_inputs(self, source_dir: Path) -> List[str]:
+        """
+        Extra state the configure result depends on besides its arguments.
+        
+        Projects whose CMakeLists.txt probes files with if(EXISTS ...)
+        override this, since CMake does not re-run when such files appear
+        or disappear.
+        
+        Args:
+            source_dir: Project source directory
+            
+        Returns:
+            List of strings recorded alongside the configure arguments
+        """
+        return []
+    
+    def configure_is_current(self, build_dir: Path, cmake_args: List[str]) -> bool:
+        """
+        Check whether a CMake build directory was configured with these arguments.
+        
+        Changes to CMakeLists.txt files do not need a check here; the
+        generated build system re-runs CMake itself during the build step.
+        Files probed by the CMakeLists.txt are covered by passing
+        configure_inputs() as part of cmake_args.
+        
+        Args:
+            build_dir: CMake build directory
+            cmake_args: Full configure command line
+            
+        Returns:
+            True if CMakeCache.txt exists and the recorded arguments match
+        """
+        if not (build_dir / "CMakeCache.txt").is_file():
+            return False
+        try:
+            recorded = (build_dir / _CONFIGURE_STAMP).read_text().strip()
+        except OSError:
+            return False
+        return recorded == _args_hash(cmake_args)
+    
+    def record_configure(self, build_dir: Path, cmake_args: List[str]) -> None:
+        """
+        Remember the arguments of a successful CMake configure.
+        
+        Args:
+            build_dir: CMake build directory
+            cmake_args: Full configure command line
+        """
+        (build_dir / _CONFIGURE_STAMP).write_text(_args_hash(cmake_args) + "\n")
+    
+    def _clean_build_dir(self, build_dir: Path) -> None:
+        """
+        Remove a build directory (CMake recreates it when configuring).
+        
+        Args:
+            build_dir: Build directory
+        """
+        if build_dir.exists():
+            print("🧹 Cleaning build directory...")
+            shutil.rmtree(build_dir)
+    
+    def _configure_settings(self, build_dir: Path, options: List[str],
+                            build_type: str = "Release", vs_platform: Optional[str] = "x64",
+                            use_ccache: bool = True) -> List[str]:
+        """
+        CMake configure arguments other than the source and build directories.
+        
+        Args:
+            build_dir: Build directory
+            options: Project-specific -D options
+            build_type: CMAKE_BUILD_TYPE for single-config generators
+            vs_platform: Visual Studio -A platform (None = generator default)
+            use_ccache: Route compiles through sccache/ccache when installed
+            
+        Returns:
+            List of arguments (options, generator, build type, launcher)
+        """
+        settings = list(options)
+        
+        # Generator (Ninja when available, Visual Studio fallback on Windows)
+        generator = self.select_cmake_generator(build_dir)
+        if generator:
+            settings.extend(["-G", generator])
+        
+        # Cap concurrent links under Ninja
+        settings.extend(self.link_pool_args(generator))
+        
+        if generator and generator.startswith("Visual Studio"):
+            if vs_platform:
+                settings.extend(["-A", vs_platform])
+        else:
+            # Multi-config generators (Visual Studio) don't use CMAKE_BUILD_TYPE
+            # Single-config generators (Ninja, Unix Makefiles) require it
+            settings.append(f"-DCMAKE_BUILD_TYPE={build_type}")
+            
+            # Compiler cache (ignored by Visual Studio generators)
+            settings.extend(self.compiler_launcher_args(use_ccache))
+        
+        return settings
+    
+    def _cmake_configure(self, source_dir: Path, build_dir: Path, options: List[str],
+                         build_type: str = "Release", vs_platform: Optional[str] = "x64",
+                         use_ccache: bool = True,
+                         echo: Optional[Callable[[str], bool]] = None) -> bool:
+        """
+        Run CMake configure step.
+        
+        Skipped when the build directory was already configured with the
+        same command line and configure_inputs().
+        
+        Args:
+            source_dir: Project source directory
+            build_dir: Build directory
+            options: Project-specific -D options
+            build_type: CMAKE_BUILD_TYPE for single-config generators
+            vs_platform: Visual Studio -A platform (None = generator default)
+            use_ccache: Route compiles through sccache/ccache when installed
+            echo: Decides which output lines are shown (None = all)
+            
+        Returns:
+            True if successful
+        """
+        print(f"⚙️  Configuring {self.project_label} with CMake...")
+        
+        cmake_args = [
+            resolve_exe("cmake"),
+            "-S", str(source_dir),
+            "-B", str(build_dir),
+            *self._configure_settings(build_dir, options, build_type, vs_platform, use_ccache),
+        ]
+        
+        # Nothing to do if this directory was configured the same way before
+        stamp_args = cmake_args + self.configure_inputs(source_dir)
+        if self.configure_is_current(build_dir, stamp_args):
+            self.print_success("CMake configuration up to date")
+            return True
+        
+        print(f"Command: {' '.join(cmake_args)}\n")
+        
+        try:
+            returncode, tail = self.run_streamed(cmake_args, tail_lines=2000, echo=echo)
+        except FileNotFoundError:
+            self.print_error("CMake not found")
+            print("\nPlease install CMake:")
+            print("  - Windows: https://cmake.org/download/")
+            print("  - Linux: sudo apt install cmake")
+            print("  - macOS: brew install cmake")
+            return False
+        
+        if returncode != 0:
+            self.print_error("CMake configuration failed")
+            # Unfiltered output has already been shown in full
+            if echo is not None:
+                print(f"\nOutput:\n{''.join(tail)}")
+            return False
+        
+        self.record_configure(build_dir, stamp_args)
+        self.print_success("CMake configuration complete")
+        return True
+    
+    def _cmake_build(self, build_dir: Path, config: str = "Release", jobs: int = 0) -> bool:
+        """
+        Run CMake build step.
+        
+        Args:
+            build_dir: Build directory
+            config: Build configuration (used by multi-config generators)
+            jobs: Number of parallel jobs (0 = auto)
+            
+        Returns:
+            True if successful
+        """
+        print(f"\n🔨 Building {self.project_label}...")
+        
+        # An explicit count: a bare --parallel means one job under MSBuild
+        cmake_args = [
+            resolve_exe("cmake"),
+            "--build", str(build_dir),
+            "--config", config,
+            "--parallel", str(jobs if jobs > 0 else detect_jobs())
+        ]
+        
+        print(f"Command: {' '.join(cmake_args)}\n")
+        
+        try:
+            # Run build with real-time output (through sys.stdout, so builds
+            # running side by side get their lines prefixed, see BuildJob)
+            returncode, _ = self.run_streamed(cmake_args, cwd=build_dir, tail_lines=1)
+            
+            if returncode == 0:
+                self.print_success(f"{self.project_label} build complete")
+                return True
+            else:
+                self.print_error(f"Build failed with exit code {returncode}")
+                return False
+        
+        except Exception as e:
+            self.print_error(f"Build error: {e}")
+            return False
+    
+    def _artifact_cache_dir(self, root_dir: Path, source_dir: Path, config: str,
+                            cache_root: str = "",
+                            settings: Sequence[str] = ()) -> Optional[Path]:
+        """
+        Directory holding the cached library for the current dependency source.
+        
+        The cache lives in .build_cache/ (or cache_root, or GODOTAI_BUILD_CACHE_DIR)
+        and is keyed by the source commit, build configuration, host platform,
+        configure settings and C++ compiler.
+        
+        Args:
+            root_dir: Repository root
+            source_dir: Dependency source directory (a git checkout)
+            config: Build configuration
+            cache_root: Cache base directory (empty = environment or .build_cache)
+            settings: Configure arguments from _configure_settings()
+            
+        Returns:
+            Cache directory, or None if the source state cannot be identified
+            (not a git checkout, or uncommitted changes)
+        """
+        try:
+            head = subprocess.run(
+                ["git", "-C", str(source_dir), "rev-parse", "HEAD"],
+                capture_output=True, text=True
+            )
+            status = subprocess.run(
+                ["git", "-C", str(source_dir), "status", "--porcelain", "--untracked-files=no"],
+                capture_output=True, text=True
+            )
+        except FileNotFoundError:
+            return None
+        
+        if head.returncode != 0 or status.returncode != 0 or status.stdout.strip():
+            return None
+        
+        key_source = "\0".join([head.stdout.strip(), config, sys.platform, platform.machine(),
+                                *settings, *toolchain_identity()])
+        key = hashlib.sha256(key_source.encode()).hexdigest()[:16]
+        
+        cache_root = cache_root or os.environ.get("GODOTAI_BUILD_CACHE_DIR", "")
+        base_dir = Path(cache_root) if cache_root else root_dir / ".build_cache"
+        return base_dir / self.project_label / key
+    
+    def _restore_cached_library(self, root_dir: Path, cache_dir: Path) -> bool:
+        """
+        Copy a cached library into build_ext_libs.
+        
+        Args:
+            root_dir: Repository root
+            cache_dir: Cache directory from _artifact_cache_dir
+            
+        Returns:
+            True if a cached library was restored
+        """
+        try:
+            with os.scandir(cache_dir) as entries:
+                cached = [Path(entry.path) for entry in entries if entry.is_file()]
+        except OSError:
+            return False
+        
+        if not cached:
+            return False
+        
+        output_dir = root_dir / "build_ext_libs"
+        if not output_dir.is_dir():
+            output_dir.mkdir(parents=True, exist_ok=True)
+        
+        for lib_file in cached:
+            self.link_or_copy(lib_file, output_dir / lib_file.name)
+            print(f"♻️  Restored {lib_file.name} from {cache_dir}")
+        
+        return True
+    
+    def _store_in_cache(self, lib_file: Path, cache_dir: Path) -> None:
+        """
+        Store a built library in the build cache.
+        
+        A real copy, so later in-place rebuilds cannot alter the cached file.
+        
+        Args:
+            lib_file: Built library
+            cache_dir: Cache directory from _artifact_cache_dir
+        """
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(lib_file, cache_dir / lib_file.name)
+        except OSError as e:
+            self.print_warning(f"Could not store library in build cache: {e}")
+    
+    def _find_lib(self, build_dir: Path, config: str) -> Optional[Path]:
+        """
+        Locate the built library. Dependency builds override this.
+        
+        Args:
+            build_dir: Build directory
+            config: Build configuration
+            
+        Returns:
+            Path to the library, or None if it was not found
+        """
+        return None
+    
+    def _copy_library(self, root_dir: Path, build_dir: Path, config: str) -> Optional[Path]:
+        """
+        Copy built library to build_ext_libs.
+        
+        Args:
+            root_dir: Repository root
+            build_dir: Build directory
+            config: Build configuration
+            
+        Returns:
+            Path of the built library that was copied, or None on failure
+        """
+        print("\n📦 Copying library to build_ext_libs...")
+        
+        # Create output directory
+        output_dir = root_dir / "build_ext_libs"
+        if not output_dir.is_dir():
+            output_dir.mkdir(parents=True, exist_ok=True)
+        
+        lib_file = self._find_lib(build_dir, config)
+        
+        if not lib_file:
+            self.print_error("Could not find built library")
+            print(f"\nSearched {build_dir} for: {', '.join(self.library_names)}")
+            # Only walk the whole build tree once something has gone wrong
+            found = sorted(p for p in build_dir.rglob("*") if p.suffix in (".a", ".lib"))[:20]
+            if found:
+                print("\nFound instead:")
+                for path in found:
+                    print(f"  - {path}")
+            return None
+        
+        # Hardlink (or copy) into the output directory
+        output_file = output_dir / lib_file.name
+        self.link_or_copy(lib_file, output_file)
+        
+        size_kb = output_file.stat().st_size / 1024
+        self.print_success(f"Copied {lib_file.name} ({size_kb:.1f} KB)")
+        print(f"  Location: {output_file}")
+        
+        return lib_file
@@ -5,15 +5,48 @@ Handles reading/writing .buildconfig.json and providing defaults.
 """
 
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+# Optional faster JSON library; stdlib json is used otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON from raw bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+@lru_cache(maxsize=16)
+def _config_path_for(root_dir: Path) -> Path:
+    """Path of the configuration file in a repository root, built once per root."""
+    return root_dir / BuildConfig.CONFIG_FILE
+
 
 class BuildConfig:
     """Manages build configuration."""
     
+    __slots__ = ("root_dir", "config_path", "_config", "_dirty")
+    
     CONFIG_FILE = ".buildconfig.json"
     
+    # Format version stamped by save(); older files are migrated on load
+    SCHEMA_VERSION = 2
+    
     DEFAULT_CONFIG = {
         "godot_version": "4.4",
         "platform": "windows",
@@ -30,39 +63,56 @@ class BuildConfig:
             root_dir: Repository root directory
         """
         self.root_dir = root_dir
-        self.config_path = root_dir / self.CONFIG_FILE
-        self._config: Dict[str, Any] = {}
+        self.config_path = _config_path_for(root_dir)
+        self._config: Optional[Dict[str, Any]] = None
+        self._dirty = False
     
     def load(self) -> Dict[str, Any]:
         """
         Load configuration from file.
         
+        The file is read once; later calls return the cached dictionary
+        (an empty file config stays cached too).
+        
         Returns:
             Configuration dictionary (or defaults if file doesn't exist)
         """
-        if self._config:
+        if self._config is not None:
             return self._config
         
         if self.config_path.exists():
-            with open(self.config_path, 'r') as f:
-                self._config = json.load(f)
-                
-                # Migrate old config values
-                if "config" in self._config:
-                    # Old key, migrate to target
-                    old_config = self._config.pop("config")
-                    if old_config == "debug":
-                        self._config["target"] = "editor"  # Debug builds are for editor
-                    elif old_config == "release":
-                        self._config["target"] = "editor"  # Still editor, just different optimization
-                
-                # Ensure target is always editor
-                self._config["target"] = "editor"
+            self._config = _json_loads(self.config_path.read_bytes())
+            
+            # Files written by save() are already in the current format
+            if self._config.get("_schema") != self.SCHEMA_VERSION:
+                self._migrate(self._config)
         else:
             self._config = self.DEFAULT_CONFIG.copy()
         
         return self._config
     
+    def _migrate(self, config: Dict[str, Any]) -> None:
+        """
+        Bring a configuration written by an older version up to date.
+        
+        The result is only written back on the next save(), which also
+        runs this so stamped files never hold legacy keys.
+        
+        Args:
+            config: Configuration loaded from file (updated in place)
+        """
+        # Migrate old config values
+        if "config" in config:
+            # Old key, migrate to target
+            old_config = config.pop("config")
+            if old_config == "debug":
+                config["target"] = "editor"  # Debug builds are for editor
+            elif old_config == "release":
+                config["target"] = "editor"  # Still editor, just different optimization
+        
+        # Ensure target is always editor
+        config["target"] = "editor"
+    
     def save(self, config: Dict[str, Any]) -> None:
         """
         Save configuration to file.
@@ -70,13 +120,18 @@ class BuildConfig:
         Args:
             config: Configuration to save
         """
-        # Ensure target is always editor
-        config["target"] = "editor"
+        # Normalize before stamping, so load() can trust the schema version
+        self._migrate(config)
+        config["_schema"] = self.SCHEMA_VERSION
         
-        with open(self.config_path, 'w') as f:
-            json.dump(config, f, indent=2)
+        # Write a temporary file and swap it in, so readers never see a partial file
+        data = _json_dumps(config)
+        tmp_path = self.config_path.with_name(self.config_path.name + ".tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, self.config_path)
         
         self._config = config
+        self._dirty = False
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -96,18 +151,24 @@ class BuildConfig:
         """
         Set a configuration value.
         
+        Changes are kept in memory until flush(), so several values can
+        be set with a single write.
+        
         Args:
             key: Configuration key
             value: Value to set
         """
         config = self.load()
-        config[key] = value
+        if key in config and config[key] == value:
+            return
         
-        # Ensure target is always editor
-        if key == "target" or "target" not in config:
-            config["target"] = "editor"
-        
-        self.save(config)
+        config[key] = value
+        self._dirty = True
+    
+    def flush(self) -> None:
+        """Write values changed by set() to the configuration file."""
+        if self._dirty:
+            self.save(self.load())
     
     def exists(self) -> bool:
         """Check if configuration file exists."""
@@ -117,4 +178,5 @@ class BuildConfig:
         """Delete configuration file."""
         if self.config_path.exists():
             self.config_path.unlink()
-        self._config = {}
\ No newline at end of file
+        self._config = None
+        self._dirty = False
\ No newline at end of file
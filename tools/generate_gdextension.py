@@ -6,16 +6,43 @@ Can be used standalone or as part of the build pipeline.
 """
 
 import argparse
+import os
+import platform as platform_module
 import sys
+import traceback
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple
 from tools.base_tool import BaseTool
 
 
+_SYSTEM = platform_module.system().lower()
+
+
+# Library file naming per platform
+_EXT = {"windows": "dll", "linux": "so", "macos": "dylib"}
+_PREFIX = {"windows": "", "linux": "lib", "macos": "lib"}
+
+# Platforms, targets and architectures included when none are given (immutable)
+_DEFAULT_PLATFORMS = ("windows", "linux", "macos")
+_DEFAULT_TARGETS = ("editor",)
+_TARGET_CHOICES = frozenset(("editor", "template_debug", "template_release"))
+
+# (platform, arch) pairs whose library key and file name carry no arch suffix
+# (universal macOS binaries)
+_OMIT_ARCH_IN_KEY = frozenset({("macos", "universal")})
+_DEFAULT_ARCHES = MappingProxyType({
+    "windows": ("x86_64",),
+    "linux": ("x86_64",),
+    "macos": ("universal",)
+})
+
+
+@lru_cache(maxsize=None)
 def detect_platform() -> str:
     """Detect the current platform."""
-    import platform
-    system = platform.system().lower()
+    system = _SYSTEM
     
     if system == "windows":
         return "windows"
@@ -29,19 +56,12 @@ def detect_platform() -> str:
 
 def get_library_extension(platform: str) -> str:
     """Get the library file extension for a platform."""
-    extensions = {
-        "windows": "dll",
-        "linux": "so",
-        "macos": "dylib"
-    }
-    return extensions.get(platform, "so")
+    return _EXT.get(platform, "so")
 
 
 def get_library_prefix(platform: str) -> str:
     """Get the library file prefix for a platform."""
-    if platform == "windows":
-        return ""
-    return "lib"
+    return _PREFIX.get(platform, "lib")
 
 
 def generate_library_path(platform: str, target: str, arch: str) -> str:
@@ -56,25 +76,49 @@ def generate_library_path(platform: str, target: str, arch: str) -> str:
     Returns:
         Library path string
     """
-    prefix = get_library_prefix(platform)
-    ext = get_library_extension(platform)
-    
-    # Build the filename
-    parts = [prefix + "gdai", platform, target]
+    return _make_path_fn(platform)(target, arch)
+
+
+def _library_key(platform: str, target: str, arch: str) -> str:
+    """
+    Key of a [libraries] entry, also the middle of its file name.
     
-    # Add arch if not universal or if platform is not macOS
-    if arch != "universal" or platform != "macos":
-        parts.append(arch)
+    Args:
+        platform: Platform name (windows, linux, macos)
+        target: Target name (editor, template_debug, template_release)
+        arch: Architecture (x86_64, arm64, universal, etc.)
+        
+    Returns:
+        Key such as "linux.editor.x86_64" (no arch for universal macOS binaries)
+    """
+    if (platform, arch) in _OMIT_ARCH_IN_KEY:
+        return f"{platform}.{target}"
+    return f"{platform}.{target}.{arch}"
+
+
+@lru_cache(maxsize=None)
+def _make_path_fn(platform: str) -> Callable[[str, str], str]:
+    """
+    Build a library path formatter specialized for one platform.
     
-    filename = ".".join(parts) + f".{ext}"
+    Prefix and extension are resolved here, once per platform, instead
+    of on every call; the key comes from _library_key.
     
-    return f"res://addons/gdai/bin/{platform}/{filename}"
+    Args:
+        platform: Platform name (windows, linux, macos)
+        
+    Returns:
+        Function mapping (target, arch) to the library path
+    """
+    head = f"res://addons/gdai/bin/{platform}/{_PREFIX.get(platform, 'lib')}gdai."
+    tail = f".{_EXT.get(platform, 'so')}"
+    return lambda target, arch: f"{head}{_library_key(platform, target, arch)}{tail}"
 
 
 def generate_gdextension_content(
-    platforms: Optional[List[str]] = None,
-    targets: Optional[List[str]] = None,
-    architectures: Optional[Dict[str, List[str]]] = None,
+    platforms: Optional[Sequence[str]] = _DEFAULT_PLATFORMS,
+    targets: Optional[Sequence[str]] = _DEFAULT_TARGETS,
+    architectures: Optional[Mapping[str, Sequence[str]]] = _DEFAULT_ARCHES,
     godot_version: str = "4.4",
     entry_symbol: str = "gdai_library_init"
 ) -> str:
@@ -82,9 +126,9 @@ def generate_gdextension_content(
     Generate the content of a .gdextension file.
     
     Args:
-        platforms: List of platforms to include (None = all)
-        targets: List of targets to include (None = editor only)
-        architectures: Dict of platform -> list of architectures
+        platforms: Platforms to include (default/None = all)
+        targets: Targets to include (default/None = editor only)
+        architectures: Mapping of platform -> architectures
         godot_version: Minimum Godot version
         entry_symbol: Entry point symbol name
         
@@ -92,58 +136,157 @@ def generate_gdextension_content(
         Complete .gdextension file content
     """
     
-    # Default values
-    if platforms is None:
-        platforms = ["windows", "linux", "macos"]
-    
-    if targets is None:
-        targets = ["editor"]
-    
-    if architectures is None:
-        architectures = {
-            "windows": ["x86_64"],
-            "linux": ["x86_64"],
-            "macos": ["universal"]
-        }
-    
-    # Start building content
-    lines = [
-        "[configuration]",
-        f'entry_symbol = "{entry_symbol}"',
-        f'compatibility_minimum = "{godot_version}"',
-        "reloadable = true",
-        "",
+    arches = architectures if architectures is not None else _DEFAULT_ARCHES
+    
+    # Hashable form of the arguments for the render cache
+    return _render(
+        tuple(platforms) if platforms is not None else _DEFAULT_PLATFORMS,
+        tuple(targets) if targets is not None else _DEFAULT_TARGETS,
+        tuple(sorted((platform, tuple(archs)) for platform, archs in arches.items())),
+        godot_version,
+        entry_symbol,
+    )
+
+
+def _header(godot_version: str, entry_symbol: str) -> str:
+    """
+    Format the [configuration] section and the [libraries] section header.
+    
+    Args:
+        godot_version: Minimum Godot version
+        entry_symbol: Entry point symbol name
+        
+    Returns:
+        Header text, without a trailing newline
+    """
+    return (
+        "[configuration]\n"
+        f'entry_symbol = "{entry_symbol}"\n'
+        f'compatibility_minimum = "{godot_version}"\n'
+        "reloadable = true\n"
+        "\n"
         "[libraries]"
+    )
+
+
+@lru_cache(maxsize=32)
+def _render(platforms: Tuple[str, ...], targets: Tuple[str, ...],
+            arch_items: Tuple[Tuple[str, Tuple[str, ...]], ...],
+            godot_version: str, entry_symbol: str) -> str:
+    """
+    Render .gdextension content (cached per argument combination).
+    
+    Args:
+        platforms: Platforms to include
+        targets: Targets to include
+        arch_items: (platform, architectures) pairs
+        godot_version: Minimum Godot version
+        entry_symbol: Entry point symbol name
+        
+    Returns:
+        Complete .gdextension file content
+    """
+    architectures = dict(arch_items)
+    
+    # One pre-formatted block per platform, joined once
+    blocks = [
+        _platform_block(platform, targets, architectures.get(platform, ("x86_64",)))
+        for platform in platforms
     ]
     
-    # Generate library entries for each platform/target/arch combination
-    for platform in platforms:
-        lines.append(f"# {platform.title()}")
+    return "\n".join((_header(godot_version, entry_symbol), *blocks))
+
+
+@lru_cache(maxsize=8)
+def _render_single(platform: str, target: str, arch: str,
+                   godot_version: str = "4.4",
+                   entry_symbol: str = "gdai_library_init") -> str:
+    """
+    Render .gdextension content for one platform/target/arch (dev builds).
+    
+    Produces the same text as generate_gdextension_content for a single
+    entry, without normalizing and walking the general arguments.
+    
+    Args:
+        platform: Platform name (windows, linux, macos)
+        target: Target name (editor, template_debug, template_release)
+        arch: Architecture (x86_64, arm64, universal, etc.)
+        godot_version: Minimum Godot version
+        entry_symbol: Entry point symbol name
         
-        for target in targets:
-            for arch in architectures.get(platform, ["x86_64"]):
-                lib_path = generate_library_path(platform, target, arch)
-                
-                # Generate the key
-                key_parts = [platform, target]
-                if arch != "universal" or platform != "macos":
-                    key_parts.append(arch)
-                key = ".".join(key_parts)
-                
-                lines.append(f'{key} = "{lib_path}"')
+    Returns:
+        Complete .gdextension file content
+    """
+    return f"{_header(godot_version, entry_symbol)}\n{_platform_block(platform, (target,), (arch,))}"
+
+
+def _platform_block(platform: str, targets: Sequence[str], archs: Sequence[str]) -> str:
+    """
+    Format the [libraries] entries of one platform.
+    
+    Args:
+        platform: Platform name (windows, linux, macos)
+        targets: Targets to include
+        archs: Architectures to include for this platform
         
-        lines.append("")  # Blank line between platforms
+    Returns:
+        Platform comment, one line per target/arch and a trailing blank line
+    """
+    # Same naming as generate_library_path
+    path_fn = _make_path_fn(platform)
+    entries = [
+        f'{_library_key(platform, target, arch)} = "{path_fn(target, arch)}"'
+        for target in targets
+        for arch in archs
+    ]
     
-    return "\n".join(lines)
+    return "\n".join((f"# {platform.title()}", *entries, ""))
 
 
 def write_gdextension_file(output_path: Path, content: str) -> None:
-    """Write the gdextension content to a file."""
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(content)
+    """
+    Write the gdextension content to a file.
+    
+    The content goes to a temporary file that replaces the target in one
+    step, so Godot never reads a partially written file.
+    """
+    data = content.encode("utf-8")
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    
+    # The directory normally exists; only create it when the write says otherwise
+    try:
+        tmp_path.write_bytes(data)
+    except FileNotFoundError:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(data)
+    
+    os.replace(tmp_path, output_path)
     print(f"✅ Generated: {output_path}")
 
 
+def _parse_targets(value: str) -> Tuple[str, ...]:
+    """
+    Parse a comma-separated --targets value.
+    
+    Args:
+        value: Targets, e.g. "editor,template_release"
+        
+    Returns:
+        Tuple of target names
+        
+    Raises:
+        argparse.ArgumentTypeError: If any target is not a known choice
+    """
+    targets = tuple(target.strip() for target in value.split(",") if target.strip())
+    invalid = set(targets) - _TARGET_CHOICES
+    if invalid or not targets:
+        raise argparse.ArgumentTypeError(
+            f"invalid target(s): {', '.join(sorted(invalid)) or value!r} "
+            f"(choose from {', '.join(sorted(_TARGET_CHOICES))})"
+        )
+    return targets
+
+
 def main():
     """CLI entry point for standalone usage."""
     parser = argparse.ArgumentParser(
@@ -170,11 +313,18 @@ def main():
         help="Generate for all platforms (default)"
     )
     
+    parser.add_argument(
+        "--targets",
+        type=_parse_targets,
+        default=_DEFAULT_TARGETS,
+        help="Comma-separated targets to include (default: editor)"
+    )
+    
     parser.add_argument(
         "--target", "-t",
-        choices=["editor", "template_debug", "template_release"],
+        choices=sorted(_TARGET_CHOICES),
         action="append",
-        help="Target(s) to include (can be specified multiple times)"
+        help="Deprecated: use --targets. Target to include (can be repeated)"
     )
     
     parser.add_argument(
@@ -191,27 +341,15 @@ def main():
     
     args = parser.parse_args()
     
-    # Determine platforms
-    if args.platform:
-        platforms = [args.platform]
-    else:
-        platforms = ["windows", "linux", "macos"]
-    
-    # Determine targets
-    targets = args.target if args.target else ["editor"]
-    
-    # Standard architectures
-    architectures = {
-        "windows": ["x86_64"],
-        "linux": ["x86_64"],
-        "macos": ["universal"]
-    }
+    # Determine platforms and targets (tuples keep the render cache key cheap)
+    platforms = (args.platform,) if args.platform else _DEFAULT_PLATFORMS
+    targets = tuple(args.target) if args.target else args.targets
     
-    # Generate content
+    # Generate content (standard architectures)
     content = generate_gdextension_content(
         platforms=platforms,
         targets=targets,
-        architectures=architectures,
+        architectures=_DEFAULT_ARCHES,
         godot_version=args.godot_version,
         entry_symbol=args.entry_symbol
     )
@@ -255,7 +393,7 @@ class GenerateGDExtensionTool(BaseTool):
     
     def execute(self, args: Dict[str, Any]) -> int:
         """Execute generation for current platform."""
-        root_dir = self.get_root_dir()
+        root_dir = self.root_dir
         output_path = root_dir / "plugin" / "gdai.gdextension"
         
         try:
@@ -270,23 +408,15 @@ class GenerateGDExtensionTool(BaseTool):
             print(f"Generating gdextension for {current_platform} {arch}...")
             
             # Generate for current platform only (for dev builds)
-            content = generate_gdextension_content(
-                platforms=[current_platform],
-                targets=["editor"],
-                architectures={
-                    current_platform: [arch]
-                }
-            )
+            content = _render_single(current_platform, "editor", arch)
             
             write_gdextension_file(output_path, content)
-            print(f"✅ Generated: {output_path}")
             print(f"   Platform: {current_platform}.editor.{arch}")
             
             return 0
             
         except Exception as e:
             print(f"❌ Error generating gdextension: {e}")
-            import traceback
             traceback.print_exc()
             return 1
 
@@ -9,13 +9,18 @@ Sets up the project by:
 """
 
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 from tools.base_tool import BaseTool, ToolArgument
 from tools.config import BuildConfig
 
 
+# Submodule path of godot-cpp (as declared in .gitmodules)
+_GODOT_CPP_PATH = "third_party/godot-cpp"
+
+
 class InitTool(BaseTool):
     """Initialize the GodotAI project."""
     
@@ -27,8 +32,7 @@ class InitTool(BaseTool):
     def description(self) -> str:
         return "Initialize project (submodules, configuration, IDE setup)"
     
-    @property
-    def arguments(self):
+    def _define_arguments(self):
         return [
             ToolArgument(
                 name="godot_version",
@@ -79,19 +83,15 @@ class InitTool(BaseTool):
     
     def execute(self, args: Dict[str, Any]) -> int:
         """Execute the init tool."""
-        root_dir = self.get_root_dir()
+        root_dir = self.root_dir
         
         print("\n" + "=" * 70)
         print("Initializing GodotAI Project")
         print("=" * 70)
         
-        # Step 1: Initialize submodules
-        if not self._init_submodules(root_dir):
-            return 1
-        
-        # Step 2: Checkout correct godot-cpp branch
+        # Steps 1-2: Initialize submodules and checkout correct godot-cpp branch
         godot_version = args["godot_version"]
-        if not self._setup_godot_cpp(root_dir, godot_version):
+        if not self._init_sources(root_dir, godot_version):
             return 1
         
         # Step 3: Save configuration
@@ -129,36 +129,105 @@ class InitTool(BaseTool):
         
         return 0
     
-    def _init_submodules(self, root_dir: Path) -> bool:
+    def _init_sources(self, root_dir: Path, version: str) -> bool:
         """
-        Initialize git submodules.
+        Initialize git submodules and check out the godot-cpp branch.
+        
+        godot-cpp is initialized first; its branch checkout then runs
+        while the remaining submodules are initialized.
         
         Args:
             root_dir: Repository root
+            version: Godot version (e.g., "4.4")
             
         Returns:
             True if successful
         """
         print("\n📦 Initializing git submodules...")
         
+        if self._submodules_current(root_dir):
+            self.print_success("Submodules already initialized")
+            return self._setup_godot_cpp(root_dir, version)
+        
+        paths = self._submodule_paths(root_dir)
+        if _GODOT_CPP_PATH not in paths:
+            # Unexpected layout - initialize everything, then report on godot-cpp
+            return self._init_submodules(root_dir) and self._setup_godot_cpp(root_dir, version)
+        
+        if not self._init_submodules(root_dir, [_GODOT_CPP_PATH]):
+            return False
+        
+        others = [path for path in paths if path != _GODOT_CPP_PATH]
+        if not others:
+            return self._setup_godot_cpp(root_dir, version)
+        
+        # Both steps mostly wait on git subprocesses working in separate repositories
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            init_future = executor.submit(self._init_submodules, root_dir, others)
+            setup_future = executor.submit(self._setup_godot_cpp, root_dir, version)
+            initialized = init_future.result()
+            setup_ok = setup_future.result()
+        
+        return initialized and setup_ok
+    
+    def _init_submodules(self, root_dir: Path, paths: Optional[List[str]] = None) -> bool:
+        """
+        Initialize git submodules.
+        
+        Args:
+            root_dir: Repository root
+            paths: Submodule paths to initialize (None = all)
+            
+        Returns:
+            True if successful
+        """
+        command = ["git", "submodule", "update", "--init", "--recursive"]
+        if paths:
+            command += ["--", *paths]
+        
         try:
             result = subprocess.run(
-                ["git", "submodule", "update", "--init", "--recursive"],
+                command,
                 cwd=root_dir,
-                capture_output=True,
-                text=True,
-                check=True
+                stdout=subprocess.DEVNULL,  # progress output is never shown
+                stderr=subprocess.PIPE
             )
-            
-            self.print_success("Submodules initialized")
-            return True
-            
-        except subprocess.CalledProcessError as e:
-            self.print_error(f"Failed to initialize submodules: {e.stderr}")
-            return False
         except FileNotFoundError:
             self.print_error("Git not found. Please install Git and try again.")
             return False
+        
+        if result.returncode != 0:
+            error = result.stderr.decode(errors="replace")
+            self.print_error(f"Failed to initialize submodules: {error}")
+            return False
+        
+        if paths:
+            self.print_success(f"Submodules initialized: {', '.join(paths)}")
+        else:
+            self.print_success("Submodules initialized")
+        return True
+    
+    def _submodule_paths(self, root_dir: Path) -> List[str]:
+        """
+        Read the submodule paths declared in .gitmodules.
+        
+        Args:
+            root_dir: Repository root
+            
+        Returns:
+            List of submodule paths (empty if .gitmodules is missing)
+        """
+        try:
+            text = (root_dir / ".gitmodules").read_text()
+        except OSError:
+            return []
+        
+        paths = []
+        for line in text.splitlines():
+            key, sep, value = line.partition("=")
+            if sep and key.strip() == "path":
+                paths.append(value.strip())
+        return paths
     
     def _setup_godot_cpp(self, root_dir: Path, version: str) -> bool:
         """
@@ -179,21 +248,79 @@ class InitTool(BaseTool):
         
         print(f"\n🎮 Setting up godot-cpp for Godot {version}...")
         
+        if self._read_head_branch(godot_cpp_dir) == version:
+            self.print_success(f"godot-cpp already on {version} branch")
+            return True
+        
+        # Checkout the version branch
+        result = subprocess.run(
+            ["git", "checkout", version],
+            cwd=godot_cpp_dir,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE
+        )
+        
+        if result.returncode != 0:
+            self.print_warning(f"Could not checkout godot-cpp {version} branch")
+            print(f"  Error: {result.stderr.decode(errors='replace').strip()}")
+            print(f"  Continuing with current branch...")
+            return True  # Non-fatal, continue anyway
+        
+        self.print_success(f"godot-cpp set to {version} branch")
+        return True
+    
+    def _submodules_current(self, root_dir: Path) -> bool:
+        """
+        Check whether every submodule is initialized at its recorded commit.
+        
+        A single ``git submodule status`` is much cheaper than
+        ``git submodule update``, which may fetch.
+        
+        Args:
+            root_dir: Repository root
+            
+        Returns:
+            True if there is nothing for ``git submodule update`` to do
+        """
+        if not (root_dir / ".gitmodules").is_file():
+            return False
+        
         try:
-            # Checkout the version branch
             result = subprocess.run(
-                ["git", "checkout", version],
-                cwd=godot_cpp_dir,
+                ["git", "submodule", "status", "--recursive"],
+                cwd=root_dir,
                 capture_output=True,
-                text=True,
-                check=True
+                text=True
             )
+        except FileNotFoundError:
+            return False
+        
+        if result.returncode != 0 or not result.stdout.strip():
+            return False
+        
+        # '-' = not initialized, '+' = different commit checked out, 'U' = conflicts
+        return not any(line[:1] in ("-", "+", "U") for line in result.stdout.splitlines())
+    
+    def _read_head_branch(self, repo_dir: Path) -> Optional[str]:
+        """
+        Read the checked-out branch of a git working tree without running git.
+        
+        Args:
+            repo_dir: Working tree (a submodule's .git may be a "gitdir:" file)
             
-            self.print_success(f"godot-cpp set to {version} branch")
-            return True
-            
-        except subprocess.CalledProcessError as e:
-            self.print_warning(f"Could not checkout godot-cpp {version} branch")
-            print(f"  Error: {e.stderr.strip()}")
-            print(f"  Continuing with current branch...")
-            return True  # Non-fatal, continue anyway
+        Returns:
+            Branch name, or None if HEAD is detached or cannot be read
+        """
+        git_path = repo_dir / ".git"
+        try:
+            if git_path.is_file():
+                gitdir = git_path.read_text().strip()
+                if not gitdir.startswith("gitdir:"):
+                    return None
+                git_path = (repo_dir / gitdir[len("gitdir:"):].strip()).resolve()
+            head = (git_path / "HEAD").read_text().strip()
+        except OSError:
+            return None
+        
+        prefix = "ref: refs/heads/"
+        return head[len(prefix):] if head.startswith(prefix) else None
@@ -7,16 +7,72 @@ Generates VS Code configuration files for optimal C++ development:
 - c_cpp_properties.json as fallback IntelliSense
 """
 
+import hashlib
 import json
+import os
 import platform
-import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Set
 
-from tools.base_tool import BaseTool
+from tools.base_tool import BaseTool, resolve_exe
 from tools.config import BuildConfig
 
 
+_SYSTEM = platform.system()
+
+# C++ source file extensions picked up for compile_commands.json
+_SOURCE_SUFFIXES = (".cpp", ".cc", ".cxx")
+
+# Preprocessor defines per platform
+_PLATFORM_DEFINES = {
+    "windows": ("_WIN32", "NOMINMAX", "GODOT_WINDOWS"),
+    "linux": ("__linux__", "GODOT_LINUXBSD"),
+    "macos": ("__APPLE__", "GODOT_MACOS"),
+}
+
+# Defines announcing optional libraries, in output order
+_DEP_DEFINES = (
+    ("libgit2", "GODOTAI_HAS_LIBGIT2"),
+    ("libhv", "GODOTAI_HAS_LIBHV"),
+)
+
+# Include directories (relative to the repo root) per dependency, in output order
+_DEP_INCLUDE_DIRS = (
+    ("godot_cpp", "third_party/godot-cpp/gdextension"),
+    ("godot_cpp", "third_party/godot-cpp/include"),
+    ("godot_cpp_gen", "third_party/godot-cpp/gen/include"),
+    ("libgit2", "third_party/libgit2/include"),
+    ("libhv", "third_party/libhv/include"),
+    ("nlohmann", "third_party/nlohmann/include"),
+    ("catch2", "third_party/catch2/src"),
+)
+
+# First line of a .clangd written by this tool (other .clangd files are never overwritten)
+_CLANGD_HEADER = "# Generated by init-vscode; changes are overwritten.\n"
+
+# Files the .clangd flags apply to (relative to the root, so third_party C sources
+# keep their own flags); a YAML single-quoted string, so backslashes stay literal
+_CLANGD_PATH_MATCH = r"src/.*\.(cpp|cc|cxx|h|hpp)"
+
+# Hash of the inputs compile_commands.json was last generated from (in .vscode/)
+_COMPILE_COMMANDS_STAMP = ".compile_commands.hash"
+
+
+def _entry_names(directory: Path) -> Set[str]:
+    """Names of a directory's entries (empty if it is missing or unreadable)."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
+
+def _on_path(name: str) -> bool:
+    """Check whether an executable is on PATH (lookups are cached by resolve_exe)."""
+    return resolve_exe(name) != name
+
+
 class InitVSCodeTool(BaseTool):
     """Initialize VS Code workspace configuration."""
     
@@ -32,13 +88,12 @@ class InitVSCodeTool(BaseTool):
     def description(self) -> str:
         return "Generate/update VS Code configuration for IntelliSense"
     
-    @property
-    def arguments(self):
+    def _define_arguments(self):
         return []
     
     def execute(self, args: Dict[str, Any]) -> int:
         """Execute the init-vscode tool."""
-        root_dir = self.get_root_dir()
+        root_dir = self.root_dir
         
         print("\n" + "=" * 70)
         print("Initializing VS Code Workspace")
@@ -63,8 +118,12 @@ class InitVSCodeTool(BaseTool):
         print(f"  Architecture: {config.get('architecture', 'x86_64')}")
         print(f"  Precision: {config.get('precision', 'single')}")
         
-        # Check dependencies
-        deps_status = self._check_dependencies(root_dir)
+        # Check dependencies and scan sources concurrently (both are independent directory walks)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            deps_future = executor.submit(self._check_dependencies, root_dir)
+            sources_future = executor.submit(self._scan_source_files, root_dir)
+            deps_status = deps_future.result()
+            sources = sources_future.result()
         
         # Create .vscode directory
         vscode_dir = root_dir / ".vscode"
@@ -74,7 +133,8 @@ class InitVSCodeTool(BaseTool):
         print()
         success = True
         
-        if not self._generate_compile_commands(root_dir, config, detected_platform, detected_compiler, deps_status):
+        if not self._generate_compile_commands(root_dir, config, detected_platform, detected_compiler,
+                                               deps_status, sources):
             success = False
         
         if not self._generate_settings_json(vscode_dir, root_dir):
@@ -116,7 +176,7 @@ class InitVSCodeTool(BaseTool):
     
     def _detect_platform(self) -> str:
         """Detect current platform."""
-        system = platform.system()
+        system = _SYSTEM
         if system == "Windows":
             return "windows"
         elif system == "Linux":
@@ -127,24 +187,35 @@ class InitVSCodeTool(BaseTool):
     
     def _detect_compiler(self) -> str:
         """Detect compiler."""
-        system = platform.system()
+        system = _SYSTEM
         if system == "Windows":
             # Check if MSVC is available
-            if shutil.which("cl"):
+            if _on_path("cl"):
                 return "msvc"
-            elif shutil.which("g++"):
+            elif _on_path("g++"):
                 return "gcc"
-            elif shutil.which("clang++"):
+            elif _on_path("clang++"):
                 return "clang"
         elif system in ["Linux", "Darwin"]:
-            if shutil.which("clang++"):
+            if _on_path("clang++"):
                 return "clang"
-            elif shutil.which("g++"):
+            elif _on_path("g++"):
                 return "gcc"
         return "unknown"
     
     def _check_dependencies(self, root_dir: Path) -> Dict[str, bool]:
-        """Check which dependencies are available."""
+        """
+        Check which dependencies are available.
+        
+        third_party/ and build_ext_libs/ are each listed once; nested
+        paths are only checked for dependencies that are present.
+        
+        Args:
+            root_dir: Repository root
+            
+        Returns:
+            Dict of dependency name -> available
+        """
         status = {
             "godot_cpp": False,
             "godot_cpp_gen": False,
@@ -154,64 +225,77 @@ class InitVSCodeTool(BaseTool):
             "catch2": False,
         }
         
-        # Check godot-cpp
-        godot_cpp = root_dir / "third_party" / "godot-cpp"
-        if godot_cpp.exists() and list(godot_cpp.iterdir()):
-            status["godot_cpp"] = True
-            # Check for generated headers
-            gen_include = godot_cpp / "gen" / "include"
-            if gen_include.exists():
-                status["godot_cpp_gen"] = True
-        
-        # Check libgit2
-        libgit2_inc = root_dir / "third_party" / "libgit2" / "include"
-        libgit2_lib_dir = root_dir / "build_ext_libs"
-        if libgit2_inc.exists():
-            if platform.system() == "Windows":
-                libgit2_lib = libgit2_lib_dir / "git2.lib"
-            else:
-                libgit2_lib = libgit2_lib_dir / "libgit2.a"
-            status["libgit2"] = libgit2_lib.exists()
-        
-        # Check libhv
-        libhv_inc = root_dir / "third_party" / "libhv" / "include"
-        if libhv_inc.exists():
-            if platform.system() == "Windows":
-                libhv_lib = libgit2_lib_dir / "hv_static.lib"
-            else:
-                libhv_lib = libgit2_lib_dir / "libhv_static.a"
-            status["libhv"] = libhv_lib.exists()
+        third_party = root_dir / "third_party"
+        present = _entry_names(third_party)
+        built_libs = _entry_names(root_dir / "build_ext_libs")
+        
+        # Check godot-cpp (an uninitialized submodule is an empty directory)
+        if "godot-cpp" in present:
+            godot_cpp = third_party / "godot-cpp"
+            godot_cpp_entries = _entry_names(godot_cpp)
+            if godot_cpp_entries:
+                status["godot_cpp"] = True
+                # Check for generated headers
+                if "gen" in godot_cpp_entries:
+                    status["godot_cpp_gen"] = (godot_cpp / "gen" / "include").exists()
+        
+        # Check libgit2 (headers and built library)
+        if "libgit2" in present and (third_party / "libgit2" / "include").exists():
+            status["libgit2"] = ("git2.lib" if _SYSTEM == "Windows" else "libgit2.a") in built_libs
+        
+        # Check libhv (headers and built library)
+        if "libhv" in present and (third_party / "libhv" / "include").exists():
+            status["libhv"] = ("hv_static.lib" if _SYSTEM == "Windows" else "libhv_static.a") in built_libs
         
         # Check nlohmann/json
-        nlohmann = root_dir / "third_party" / "nlohmann" / "include"
-        status["nlohmann"] = nlohmann.exists()
+        if "nlohmann" in present:
+            status["nlohmann"] = (third_party / "nlohmann" / "include").exists()
         
         # Check catch2
-        catch2 = root_dir / "third_party" / "catch2" / "src"
-        status["catch2"] = catch2.exists()
+        if "catch2" in present:
+            status["catch2"] = (third_party / "catch2" / "src").exists()
         
         return status
     
     def _scan_source_files(self, root_dir: Path) -> List[Path]:
-        """Scan for all C++ source files."""
-        src_dir = root_dir / "src"
-        if not src_dir.exists():
-            return []
+        """
+        Scan for all C++ source files.
         
+        src/ is walked once with os.scandir, matching every extension in the
+        same pass; only matching entries are turned into Path objects.
+        
+        Args:
+            root_dir: Repository root
+            
+        Returns:
+            List of source file paths (empty if src/ is missing)
+        """
         sources = []
-        for ext in ["*.cpp", "*.cc", "*.cxx"]:
-            sources.extend(src_dir.rglob(ext))
+        pending = [str(root_dir / "src")]
+        
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.name.endswith(_SOURCE_SUFFIXES):
+                            sources.append(Path(entry.path))
+            except OSError:
+                continue  # Missing or unreadable directory
         
         return sources
     
     def _generate_compile_commands(self, root_dir: Path, config: Dict[str, Any],
                                    detected_platform: str, compiler: str,
-                                   deps_status: Dict[str, bool]) -> bool:
-        """Generate compile_commands.json."""
+                                   deps_status: Dict[str, bool],
+                                   sources: Optional[List[Path]] = None) -> bool:
+        """Generate compile_commands.json (sources are scanned if not given)."""
         print("📝 Generating compile_commands.json...")
         
         # Get all source files
-        sources = self._scan_source_files(root_dir)
+        if sources is None:
+            sources = self._scan_source_files(root_dir)
         if not sources:
             self.print_warning("No source files found in src/")
             return True  # Non-fatal
@@ -225,43 +309,109 @@ class InitVSCodeTool(BaseTool):
         # Build compiler command
         compiler_path = self._get_compiler_path(compiler)
         
-        # Generate compile commands
-        commands = []
-        for source in sources:
-            rel_path = source.relative_to(root_dir)
-            
-            # Build command arguments
-            args = [compiler_path]
-            
-            # Add standard
-            args.append("-std=c++17")
-            
-            # Add includes
-            for inc in include_paths:
-                args.append(f"-I{inc}")
+        # The flags are the same for every source; clangd reads them from .clangd
+        # when possible, so each entry only names the compiler and its file
+        flags = [
+            "-std=c++17",
+            *[f"-I{inc}" for inc in include_paths],
+            *[f"-D{define}" for define in defines],
+        ]
+        if self._write_clangd_config(root_dir, flags):
+            row_prefix = [compiler_path]
+        else:
+            row_prefix = [compiler_path, *flags]
+        
+        directory_json = json.dumps(str(root_dir))
+        arguments_json = json.dumps([*row_prefix, "-c"], separators=(",", ":"))[:-1]
+        # Sources come from walking root_dir/src, so cutting the root prefix is enough
+        root_prefix_len = len(str(root_dir)) + 1
+        rel_paths = [str(source)[root_prefix_len:] for source in sources]
+        
+        # Leave an up-to-date file alone so clangd keeps its background index
+        output_file = root_dir / "compile_commands.json"
+        stamp_file = root_dir / ".vscode" / _COMPILE_COMMANDS_STAMP
+        digest = hashlib.sha256("\0".join([str(root_dir), *row_prefix, *rel_paths]).encode()).hexdigest()
+        if output_file.is_file():
+            try:
+                recorded = stamp_file.read_text().strip()
+            except OSError:
+                recorded = ""
+            if recorded == digest:
+                self.print_success(f"compile_commands.json unchanged ({len(rel_paths)} files)")
+                return True
+        
+        # Write compile_commands.json one compact entry per line (clangd ignores
+        # formatting), into a temporary file that replaces the old one in one step
+        tmp_file = output_file.with_name(output_file.name + ".tmp")
+        try:
+            with open(tmp_file, 'w') as f:
+                f.write("[\n")
+                for index, rel_path in enumerate(rel_paths):
+                    if index:
+                        f.write(",\n")
+                    file_json = json.dumps(rel_path)
+                    f.write(
+                        f'{{"directory":{directory_json},'
+                        f'"arguments":{arguments_json},{file_json}],'
+                        f'"file":{file_json}}}'
+                    )
+                f.write("\n]\n")
+            os.replace(tmp_file, output_file)
             
-            # Add defines
-            for define in defines:
-                args.append(f"-D{define}")
+            stamp_tmp = stamp_file.with_name(stamp_file.name + ".tmp")
+            stamp_tmp.write_text(digest + "\n")
+            os.replace(stamp_tmp, stamp_file)
             
-            # Add source file
-            args.append(str(rel_path))
+            self.print_success(f"Generated compile_commands.json ({len(rel_paths)} files)")
+            return True
+        except Exception as e:
+            self.print_error(f"Failed to write compile_commands.json: {e}")
+            return False
+    
+    def _write_clangd_config(self, root_dir: Path, flags: List[str]) -> bool:
+        """
+        Write the shared compile flags to a .clangd file in the project root.
+        
+        The flags are limited to the plugin's sources under src/ (see
+        _CLANGD_PATH_MATCH). A .clangd that was not generated by this tool
+        is left alone.
+        
+        Args:
+            root_dir: Repository root
+            flags: Compile flags applied to every source file
             
-            commands.append({
-                "directory": str(root_dir),
-                "command": " ".join(args),
-                "file": str(rel_path),
-            })
+        Returns:
+            True if .clangd carries the flags, False if they must stay in
+            compile_commands.json
+        """
+        clangd_file = root_dir / ".clangd"
+        # Double-quoted YAML strings use the same escapes as JSON
+        text = (
+            _CLANGD_HEADER
+            + f"If:\n  PathMatch: '{_CLANGD_PATH_MATCH}'\n"
+            + "CompileFlags:\n  Add: [" + ", ".join(json.dumps(flag) for flag in flags) + "]\n"
+        )
         
-        # Write compile_commands.json
-        output_file = root_dir / "compile_commands.json"
         try:
-            with open(output_file, 'w') as f:
-                json.dump(commands, f, indent=2)
-            self.print_success(f"Generated compile_commands.json ({len(commands)} files)")
+            current = clangd_file.read_text()
+        except OSError:
+            current = None
+        
+        if current == text:
+            return True
+        if current is not None and not current.startswith(_CLANGD_HEADER):
+            self.print_warning(".clangd was not generated by init-vscode; "
+                               "keeping compile flags in compile_commands.json")
+            return False
+        
+        try:
+            tmp_file = clangd_file.with_name(clangd_file.name + ".tmp")
+            tmp_file.write_text(text)
+            os.replace(tmp_file, clangd_file)
+            self.print_success("Generated .clangd (shared compile flags)")
             return True
         except Exception as e:
-            self.print_error(f"Failed to write compile_commands.json: {e}")
+            self.print_warning(f"Failed to write .clangd: {e}")
             return False
     
     def _generate_settings_json(self, vscode_dir: Path, root_dir: Path) -> bool:
@@ -300,18 +450,10 @@ class InitVSCodeTool(BaseTool):
         }
         
         # Merge settings (preserve user settings)
-        for key, value in godotai_settings.items():
-            existing[key] = value
+        existing.update(godotai_settings)
         
         # Write settings.json
-        try:
-            with open(settings_file, 'w') as f:
-                json.dump(existing, f, indent=2)
-            self.print_success("Generated .vscode/settings.json")
-            return True
-        except Exception as e:
-            self.print_error(f"Failed to write settings.json: {e}")
-            return False
+        return self._write_json_file(settings_file, existing, ".vscode/settings.json")
     
     def _generate_cpp_properties(self, vscode_dir: Path, root_dir: Path,
                                 config: Dict[str, Any], detected_platform: str,
@@ -361,94 +503,98 @@ class InitVSCodeTool(BaseTool):
         existing["configurations"].insert(0, godotai_config)
         
         # Write c_cpp_properties.json
+        return self._write_json_file(cpp_props_file, existing, ".vscode/c_cpp_properties.json")
+    
+    def _write_json_file(self, path: Path, data: Any, label: str) -> bool:
+        """
+        Write an indented JSON file atomically, if its content changed.
+        
+        The JSON goes to a temporary file that replaces the target in one
+        step, so VS Code never reads a partially written file. An identical
+        file is left untouched (VS Code reloads settings when they change).
+        
+        Args:
+            path: File to write
+            data: JSON-serializable content
+            label: Name shown in status messages
+            
+        Returns:
+            True if successful
+        """
+        text = json.dumps(data, indent=2)
         try:
-            with open(cpp_props_file, 'w') as f:
-                json.dump(existing, f, indent=2)
-            self.print_success("Generated .vscode/c_cpp_properties.json")
+            if path.read_text() == text:
+                self.print_success(f"{label} unchanged")
+                return True
+        except OSError:
+            pass  # Missing or unreadable, write it
+        
+        tmp_path = path.with_name(path.name + ".tmp")
+        try:
+            tmp_path.write_text(text)
+            os.replace(tmp_path, path)
+            self.print_success(f"Generated {label}")
             return True
         except Exception as e:
-            self.print_error(f"Failed to write c_cpp_properties.json: {e}")
+            self.print_error(f"Failed to write {path.name}: {e}")
             return False
     
     def _get_include_paths(self, root_dir: Path, deps_status: Dict[str, bool]) -> List[Path]:
-        """Get all include paths."""
-        paths = []
-        
-        # Source directory
-        paths.append(root_dir / "src")
-        
-        # godot-cpp
-        if deps_status["godot_cpp"]:
-            paths.append(root_dir / "third_party" / "godot-cpp" / "gdextension")
-            paths.append(root_dir / "third_party" / "godot-cpp" / "include")
-            if deps_status["godot_cpp_gen"]:
-                paths.append(root_dir / "third_party" / "godot-cpp" / "gen" / "include")
-        
-        # libgit2
-        if deps_status["libgit2"]:
-            paths.append(root_dir / "third_party" / "libgit2" / "include")
-        
-        # libhv
-        if deps_status["libhv"]:
-            paths.append(root_dir / "third_party" / "libhv" / "include")
-        
-        # nlohmann/json
-        if deps_status["nlohmann"]:
-            paths.append(root_dir / "third_party" / "nlohmann" / "include")
-        
-        # catch2
-        if deps_status["catch2"]:
-            paths.append(root_dir / "third_party" / "catch2" / "src")
-        
+        """Get all include paths (computed once per dependency state)."""
+        key = (root_dir, frozenset(deps_status.items()))
+        if getattr(self, '_include_paths_cache', None) is None:
+            self._include_paths_cache = {}
+        elif key in self._include_paths_cache:
+            return self._include_paths_cache[key]
+        
+        # Source directory, then the include directories of available dependencies
+        paths = [root_dir / "src"]
+        paths.extend(root_dir / include_dir
+                     for dep, include_dir in _DEP_INCLUDE_DIRS if deps_status[dep])
+        
+        self._include_paths_cache[key] = paths
         return paths
     
     def _get_defines(self, config: Dict[str, Any], detected_platform: str,
                     deps_status: Dict[str, bool]) -> List[str]:
-        """Get all preprocessor defines."""
-        defines = []
+        """Get all preprocessor defines (computed once per configuration)."""
+        key = (detected_platform, config.get("target", "editor"), config.get("config", "release"),
+               config.get("precision", "single"), frozenset(deps_status.items()))
+        if getattr(self, '_defines_cache', None) is None:
+            self._defines_cache = {}
+        elif key in self._defines_cache:
+            return self._defines_cache[key]
         
         # Platform defines
-        if detected_platform == "windows":
-            defines.extend(["_WIN32", "NOMINMAX", "GODOT_WINDOWS"])
-        elif detected_platform == "linux":
-            defines.extend(["__linux__", "GODOT_LINUXBSD"])
-        elif detected_platform == "macos":
-            defines.extend(["__APPLE__", "GODOT_MACOS"])
+        defines = list(_PLATFORM_DEFINES.get(detected_platform, ()))
         
         # Build type defines
-        target = config.get("target", "editor")
-        if target == "editor":
+        if config.get("target", "editor") == "editor":
             defines.append("TOOLS_ENABLED")
         
-        build_config = config.get("config", "release")
-        if build_config == "debug":
+        if config.get("config", "release") == "debug":
             defines.append("DEBUG_ENABLED")
         
         # Precision defines
-        precision = config.get("precision", "single")
-        if precision == "single":
+        if config.get("precision", "single") == "single":
             defines.append("REAL_T_IS_FLOAT")
         else:
             defines.append("REAL_T_IS_DOUBLE")
         
         # Dependency defines
-        if deps_status["libgit2"]:
-            defines.append("GODOTAI_HAS_LIBGIT2")
-        
-        if deps_status["libhv"]:
-            defines.append("GODOTAI_HAS_LIBHV")
+        defines.extend(define for dep, define in _DEP_DEFINES if deps_status[dep])
         
+        self._defines_cache[key] = defines
         return defines
     
     def _get_compiler_path(self, compiler: str) -> str:
         """Get compiler path."""
         if compiler == "msvc":
-            cl_path = shutil.which("cl")
-            return cl_path if cl_path else "cl"
+            return resolve_exe("cl")
         elif compiler == "gcc":
-            return shutil.which("g++") or "g++"
+            return resolve_exe("g++")
         elif compiler == "clang":
-            return shutil.which("clang++") or "clang++"
+            return resolve_exe("clang++")
         return "c++"
     
     def _get_intellisense_mode(self, detected_platform: str, compiler: str) -> str:
@@ -5,13 +5,35 @@ Installs the built GodotAI plugin into a Godot project with the correct
 directory structure: addons/gdai/
 """
 
+import os
 import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 
 from tools.base_tool import BaseTool, ToolArgument
 
 
+# project.godot written into a newly created project scaffold
+_PROJECT_GODOT_TEMPLATE = (
+    b"; Engine configuration file.\n"
+    b"; It's best edited using the editor UI and not directly,\n"
+    b"; since the parameters that go here are not all obvious.\n"
+    b";\n"
+    b"; Format:\n"
+    b";   [section] ; section goes between []\n"
+    b";   param=value ; assign values to parameters\n"
+    b"\n"
+    b"config_version=5\n"
+    b"\n"
+    b"[application]\n"
+    b"\n"
+    b'config/name="GodotAI Test Project"\n'
+    b'config/features=PackedStringArray("4.4")\n'
+)
+
+
 class InstallTool(BaseTool):
     """Install GodotAI plugin to a Godot project."""
     
@@ -27,8 +49,7 @@ class InstallTool(BaseTool):
     def category(self) -> str:
         return "install"
     
-    @property
-    def arguments(self):
+    def _define_arguments(self):
         return [
             ToolArgument(
                 name="project_path",
@@ -48,7 +69,7 @@ class InstallTool(BaseTool):
     
     def execute(self, args: Dict[str, Any]) -> int:
         """Execute the install tool."""
-        root_dir = self.get_root_dir()
+        root_dir = self.root_dir
         
         # Get project path
         project_path = args.get("project_path", "").strip()
@@ -170,22 +191,7 @@ class InstallTool(BaseTool):
             # Create project.godot file
             project_godot = project_dir / "project.godot"
             if not project_godot.exists():
-                project_godot.write_text(
-                    "; Engine configuration file.\n"
-                    "; It's best edited using the editor UI and not directly,\n"
-                    "; since the parameters that go here are not all obvious.\n"
-                    ";\n"
-                    "; Format:\n"
-                    ";   [section] ; section goes between []\n"
-                    ";   param=value ; assign values to parameters\n"
-                    "\n"
-                    "config_version=5\n"
-                    "\n"
-                    "[application]\n"
-                    "\n"
-                    'config/name="GodotAI Test Project"\n'
-                    'config/features=PackedStringArray("4.4")\n'
-                )
+                project_godot.write_bytes(_PROJECT_GODOT_TEMPLATE)
                 print(f"✓ Created project.godot")
             
             # Create addons directory
@@ -240,13 +246,10 @@ class InstallTool(BaseTool):
                     if target_subdir.exists():
                         shutil.rmtree(target_subdir)
                     
-                    # Copy directory
-                    shutil.copytree(src_dir, target_subdir)
+                    # Copy directory (entries are counted while copying)
+                    dir_count, file_count = self._parallel_copytree(src_dir, target_subdir)
                     print(f"✓ Copied {dirname}/ directory")
-                    
-                    # Count files
-                    file_count = sum(1 for _ in target_subdir.rglob('*') if _.is_file())
-                    print(f"  ({file_count} files)")
+                    print(f"  ({file_count} files, {dir_count - 1} subdirectories)")
                 else:
                     self.print_warning(f"Source directory not found: {dirname}/")
             
@@ -258,6 +261,49 @@ class InstallTool(BaseTool):
             traceback.print_exc()
             return False
     
+    def _parallel_copytree(self, src_dir: Path, dst_dir: Path, workers: int = 8) -> Tuple[int, int]:
+        """
+        Copy a directory tree, copying files concurrently.
+        
+        The tree is walked once with os.scandir, creating target directories
+        on the way; file copies (I/O-bound) then run on a thread pool.
+        Like shutil.copytree, symlinks are followed and metadata is kept.
+        
+        Args:
+            src_dir: Directory to copy
+            dst_dir: Target directory (created if needed)
+            workers: Maximum number of concurrent copies
+            
+        Returns:
+            Tuple of (directories created including dst_dir, files copied)
+        """
+        directories = []
+        copies = []
+        pending = [(str(src_dir), str(dst_dir))]
+        
+        while pending:
+            src, dst = pending.pop()
+            os.makedirs(dst, exist_ok=True)
+            directories.append((src, dst))
+            with os.scandir(src) as entries:
+                for entry in entries:
+                    target = os.path.join(dst, entry.name)
+                    if entry.is_dir():
+                        pending.append((entry.path, target))
+                    else:
+                        copies.append((entry.path, target))
+        
+        if copies:
+            with ThreadPoolExecutor(max_workers=min(workers, len(copies))) as executor:
+                # list() re-raises the first failed copy
+                list(executor.map(lambda pair: shutil.copy2(*pair), copies))
+        
+        # Directory metadata last, once nothing is written into them anymore
+        for src, dst in directories:
+            shutil.copystat(src, dst)
+        
+        return len(directories), len(copies)
+    
     def _show_install_summary(self, addon_dir: Path):
         """
         Show installation summary.
@@ -273,21 +319,28 @@ class InstallTool(BaseTool):
         print("\n📁 Installed structure:")
         self._print_tree(addon_dir, prefix="", max_depth=3)
         
-        # Show library files
+        # Show library files (one listing per directory, no per-file stat calls)
         bin_dir = addon_dir / "bin"
         if bin_dir.exists():
             print("\n📦 Installed libraries:")
-            for platform_dir in sorted(bin_dir.iterdir()):
-                if platform_dir.is_dir():
-                    for lib_file in sorted(platform_dir.iterdir()):
-                        if lib_file.is_file():
-                            size_mb = lib_file.stat().st_size / (1024 * 1024)
-                            print(f"  {platform_dir.name}/{lib_file.name} ({size_mb:.2f} MB)")
+            with os.scandir(bin_dir) as platform_entries:
+                platform_dirs = sorted((entry for entry in platform_entries if entry.is_dir()),
+                                       key=lambda entry: entry.name)
+            for platform_dir in platform_dirs:
+                with os.scandir(platform_dir.path) as lib_entries:
+                    lib_files = sorted((entry for entry in lib_entries if entry.is_file()),
+                                       key=lambda entry: entry.name)
+                for lib_file in lib_files:
+                    size_mb = lib_file.stat().st_size / (1024 * 1024)
+                    print(f"  {platform_dir.name}/{lib_file.name} ({size_mb:.2f} MB)")
     
     def _print_tree(self, directory: Path, prefix: str = "", max_depth: int = 3, current_depth: int = 0):
         """
         Print directory tree.
         
+        The tree is read in a single os.walk pass (no per-entry stat
+        calls) and the output is written in one go.
+        
         Args:
             directory: Directory to print
             prefix: Prefix for tree lines
@@ -297,20 +350,43 @@ class InstallTool(BaseTool):
         if current_depth >= max_depth:
             return
         
-        try:
-            entries = sorted(directory.iterdir(), key=lambda x: (not x.is_dir(), x.name))
+        # path -> (child names, whether each child is a directory); subdirectories first
+        top = str(directory)
+        depths = {top: current_depth}
+        children = {}
+        for dirpath, dirnames, filenames in os.walk(top, followlinks=True):
+            dirnames.sort()
+            filenames.sort()
+            children[dirpath] = [(name, True) for name in dirnames] + [(name, False) for name in filenames]
             
-            for i, entry in enumerate(entries):
-                is_last = i == len(entries) - 1
-                
-                if is_last:
-                    print(f"{prefix}└── {entry.name}")
-                    new_prefix = prefix + "    "
-                else:
-                    print(f"{prefix}├── {entry.name}")
-                    new_prefix = prefix + "│   "
-                
-                if entry.is_dir():
-                    self._print_tree(entry, new_prefix, max_depth, current_depth + 1)
-        except PermissionError:
-            pass
\ No newline at end of file
+            depth = depths[dirpath] + 1
+            if depth >= max_depth:
+                dirnames[:] = []  # Deeper levels are not printed
+            for name in dirnames:
+                depths[os.path.join(dirpath, name)] = depth
+        
+        lines = []
+        stack = [(top, prefix, iter(children.get(top, ())))]
+        while stack:
+            path, line_prefix, entries = stack[-1]
+            entry = next(entries, None)
+            if entry is None:
+                stack.pop()
+                continue
+            
+            name, is_dir = entry
+            siblings = children[path]
+            if entry is siblings[-1]:
+                lines.append(f"{line_prefix}└── {name}")
+                new_prefix = line_prefix + "    "
+            else:
+                lines.append(f"{line_prefix}├── {name}")
+                new_prefix = line_prefix + "│   "
+            
+            child = os.path.join(path, name)
+            if is_dir and child in children:
+                stack.append((child, new_prefix, iter(children[child])))
+        
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
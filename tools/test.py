@@ -20,8 +20,7 @@ class TestTool(BaseTool):
     def description(self) -> str:
         return "Test tool to verify the build system is working"
     
-    @property
-    def arguments(self):
+    def _define_arguments(self):
         return [
             ToolArgument(
                 name="message",